@@ -0,0 +1,45 @@
+"""Build the AOT-compiled ``tayfin_kernels`` extension module.
+
+Run once at image build time (after ``pip install -r requirements-dev.txt``):
+
+    python scripts/build_kernels.py
+
+This pre-compiles the rolling-mean kernel with numba.pycc so the jobs
+load a ready extension module at import time instead of paying JIT
+warmup in every short-lived process.  The output .so lands next to the
+package sources; ``tayfin_indicator_jobs.indicator.kernels`` picks it up
+automatically and falls back to pure Python when it is missing.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from numba.pycc import CC  # noqa: E402
+
+from tayfin_indicator_jobs.indicator.kernels import (  # noqa: E402
+    ROLLING_MEANS_INT_SIGNATURE,
+    ROLLING_MEANS_SIGNATURE,
+    SIMPLE_RETURNS_SIGNATURE,
+    _rolling_means_int_py,
+    _rolling_means_py,
+    _simple_returns_py,
+)
+
+
+def main() -> None:
+    cc = CC("tayfin_kernels")
+    cc.output_dir = str(SRC)
+    cc.export("rolling_means", ROLLING_MEANS_SIGNATURE)(_rolling_means_py)
+    cc.export("rolling_means_int", ROLLING_MEANS_INT_SIGNATURE)(_rolling_means_int_py)
+    cc.export("simple_returns", SIMPLE_RETURNS_SIGNATURE)(_simple_returns_py)
+    cc.compile()
+    print(f"built tayfin_kernels in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
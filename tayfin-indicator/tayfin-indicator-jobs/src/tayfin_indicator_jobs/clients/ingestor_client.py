@@ -6,10 +6,12 @@ without crossing schema boundaries (API-only rule).
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from datetime import date
 
+import httpx
 import requests
 
 
@@ -29,6 +31,9 @@ _RETRYABLE_STATUS = {429, 503}
 class IngestorClient:
     """Thin, resilient HTTP wrapper around tayfin-ingestor-api."""
 
+    #: Concurrent in-flight requests for the fan-out path.
+    MAX_CONCURRENCY = 32
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -77,6 +82,54 @@ class IngestorClient:
         data = self._get_json(url, params)
         return data.get("items", [])
 
+    def get_ohlcv_range_many(
+        self,
+        tickers: list[str],
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, list[dict] | Exception]:
+        """Fetch OHLCV for many tickers concurrently.
+
+        Issues all requests over one pooled httpx.AsyncClient, at most
+        MAX_CONCURRENCY in flight.  Returns ``{ticker: candles}``; a
+        ticker whose fetch failed (after the same retry policy as
+        :meth:`get_ohlcv_range`) maps to the exception instead, so
+        callers can audit per-ticker failures without losing the batch.
+        """
+        return asyncio.run(self._fetch_many(tickers, start_date, end_date))
+
+    async def _fetch_many(
+        self,
+        tickers: list[str],
+        start_date: date | None,
+        end_date: date | None,
+    ) -> dict[str, list[dict] | Exception]:
+        url = f"{self.base_url}/ohlcv"
+        base_params: dict[str, str] = {}
+        if start_date:
+            base_params["from"] = start_date.isoformat()
+        if end_date:
+            base_params["to"] = end_date.isoformat()
+
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        limits = httpx.Limits(max_connections=self.MAX_CONCURRENCY * 2)
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout_s, limits=limits
+        ) as client:
+
+            async def fetch(ticker: str) -> list[dict]:
+                async with sem:
+                    data = await self._aget_json(
+                        client, url, {"ticker": ticker, **base_params}
+                    )
+                return data.get("items", [])
+
+            results = await asyncio.gather(
+                *(fetch(t) for t in tickers), return_exceptions=True
+            )
+        return dict(zip(tickers, results))
+
     # ------------------------------------------------------------------
     # Internal retry loop
     # ------------------------------------------------------------------
@@ -104,5 +157,27 @@ class IngestorClient:
             raise last_exc
         raise RuntimeError("Exhausted retries without a captured exception")
 
+    async def _aget_json(
+        self, client: httpx.AsyncClient, url: str, params: dict
+    ) -> dict:
+        """Async twin of :meth:`_get_json` — same retry/backoff policy."""
+        last_exc: Exception | None = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                resp = await client.get(url, params=params)
+                if resp.is_success:
+                    return resp.json()
+                if resp.status_code in _RETRYABLE_STATUS:
+                    last_exc = IngestorApiError(resp.status_code, resp.text, url)
+                    await asyncio.sleep(self.backoff_s * attempt)
+                    continue
+                raise IngestorApiError(resp.status_code, resp.text, url)
+            except httpx.HTTPError as exc:
+                last_exc = exc
+                await asyncio.sleep(self.backoff_s * attempt)
+        if last_exc is not None:
+            raise last_exc
+        raise RuntimeError("Exhausted retries without a captured exception")
+
     def _sleep(self, attempt: int) -> None:
         time.sleep(self.backoff_s * attempt)
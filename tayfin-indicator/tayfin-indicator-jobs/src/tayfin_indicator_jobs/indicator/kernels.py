@@ -0,0 +1,173 @@
+"""Rolling-mean kernels shared by the indicator jobs.
+
+The jobs are short-lived batch processes, so Numba JIT warmup would be
+paid on every run.  Instead ``scripts/build_kernels.py`` AOT-compiles
+:func:`_rolling_means_py` into a ``tayfin_kernels`` extension module at
+build time; at import time we prefer the precompiled kernel and fall
+back to the plain-Python implementation when the module is absent
+(e.g. in dev checkouts and CI where the build step has not run).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+#: Signatures used by scripts/build_kernels.py for the AOT exports.
+ROLLING_MEANS_SIGNATURE = "void(f8[:], i8[:], f8[:,:])"
+ROLLING_MEANS_INT_SIGNATURE = "void(i8[:], i8[:], f8[:,:])"
+SIMPLE_RETURNS_SIGNATURE = "void(f8[:], f8[:])"
+
+
+def _rolling_means_py(vol, windows, out):  # pragma: no branch - kernel source
+    """Rolling mean of *vol* for every window in *windows*, into *out*.
+
+    ``out[k, i]`` is the mean of ``vol[i - windows[k] + 1 : i + 1]``;
+    positions with fewer than ``windows[k]`` samples are NaN.  All
+    windows share one prefix-sum pass, so *vol* is read once instead of
+    once per window.  Written as plain loops so the same source compiles
+    under Numba nopython mode (see ROLLING_MEANS_SIGNATURE).
+    """
+    n = vol.shape[0]
+    c = np.empty(n + 1, dtype=np.float64)
+    c[0] = 0.0
+    for i in range(n):
+        c[i + 1] = c[i] + vol[i]
+    for k in range(windows.shape[0]):
+        w = windows[k]
+        if w <= 0 or w > n:
+            for i in range(n):
+                out[k, i] = np.nan
+            continue
+        for i in range(w - 1):
+            out[k, i] = np.nan
+        for i in range(w - 1, n):
+            out[k, i] = (c[i + 1] - c[i + 1 - w]) / w
+
+
+def _rolling_means_int_py(vol, windows, out):  # pragma: no branch - kernel source
+    """Integer specialization of :func:`_rolling_means_py`.
+
+    Volume is integral in practice, so an int64 prefix sum avoids FP
+    rounding in the accumulator entirely; the single division per output
+    element is the only float op.  Same shared-prefix-sum structure and
+    NaN-prefix contract as the float kernel.
+    """
+    n = vol.shape[0]
+    c = np.empty(n + 1, dtype=np.int64)
+    c[0] = 0
+    for i in range(n):
+        c[i + 1] = c[i] + vol[i]
+    for k in range(windows.shape[0]):
+        w = windows[k]
+        if w <= 0 or w > n:
+            for i in range(n):
+                out[k, i] = np.nan
+            continue
+        for i in range(w - 1):
+            out[k, i] = np.nan
+        for i in range(w - 1, n):
+            out[k, i] = (c[i + 1] - c[i + 1 - w]) / w
+
+
+def _simple_returns_py(close, out):  # pragma: no branch - kernel source
+    """Period-over-period simple returns of *close*, into *out*.
+
+    ``out[i]`` is ``close[i] / close[i-1] - 1``; position 0 and any
+    position whose predecessor is 0 are NaN.  Same plain-loop style as
+    the rolling-mean kernels so the source compiles under Numba
+    nopython mode (see SIMPLE_RETURNS_SIGNATURE).
+    """
+    n = close.shape[0]
+    if n > 0:
+        out[0] = np.nan
+    for i in range(1, n):
+        prev = close[i - 1]
+        if prev == 0.0:
+            out[i] = np.nan
+        else:
+            out[i] = close[i] / prev - 1.0
+
+
+try:  # Prefer the AOT-compiled kernels — no warmup, loaded at import.
+    from tayfin_kernels import (  # type: ignore[import-not-found]
+        rolling_means,
+        rolling_means_int,
+        simple_returns,
+    )
+
+    HAVE_AOT_KERNELS = True
+except ImportError:  # Build step not run — fall back to the Python source.
+    rolling_means = _rolling_means_py
+    rolling_means_int = _rolling_means_int_py
+    simple_returns = _simple_returns_py
+    HAVE_AOT_KERNELS = False
+
+
+def rolling_means_matrix(values: np.ndarray, windows: list[int]) -> np.ndarray:
+    """Return a ``(len(windows), len(values))`` float64 rolling-mean matrix.
+
+    Integer input dispatches to the int64 running-sum kernel; anything
+    else goes through the float64 kernel.
+    """
+    values = np.asarray(values)
+    win = np.asarray(windows, dtype=np.int64)
+    out = np.empty((win.shape[0], values.shape[0]), dtype=np.float64)
+    if values.dtype.kind in "iu":
+        rolling_means_int(np.ascontiguousarray(values, dtype=np.int64), win, out)
+    else:
+        rolling_means(np.ascontiguousarray(values, dtype=np.float64), win, out)
+    return out
+
+
+def simple_returns_vector(values: np.ndarray) -> np.ndarray:
+    """Return period-over-period simple returns as a float64 vector.
+
+    ``out[0]`` is NaN (no predecessor), as is any position following a
+    zero close.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    out = np.empty(values.shape[0], dtype=np.float64)
+    simple_returns(values, out)
+    return out
+
+
+def rolling_means_batch(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    windows: list[int],
+) -> np.ndarray:
+    """Rolling means for a whole ticker batch in one vectorized pass.
+
+    *values* is a NaN-padded ``(T, N)`` float64 array of T tickers with
+    up to N bars each; ``lengths[t]`` is the valid bar count of row t.
+    Returns a ``(len(windows), T, N)`` matrix with the same per-row NaN
+    contract as :func:`rolling_means_matrix` — positions before the
+    window fills, and the padded tail beyond ``lengths[t]``, are NaN.
+
+    One ``np.cumsum`` over the batch replaces T kernel calls; useful
+    when all series are already in memory.  Jagged batches (very uneven
+    lengths) waste work on padding — the per-ticker kernel path remains
+    the right choice for streaming pipelines.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    n_tickers, n_bars = values.shape
+    win = np.asarray(windows, dtype=np.int64)
+
+    # Shared prefix sum with a zero column prepended, padding as 0.
+    cs = np.zeros((n_tickers, n_bars + 1), dtype=np.float64)
+    np.cumsum(np.nan_to_num(values), axis=1, out=cs[:, 1:])
+
+    col = np.arange(n_bars)
+    out = np.empty((win.shape[0], n_tickers, n_bars), dtype=np.float64)
+    for k, w in enumerate(win):
+        if w <= 0:
+            out[k] = np.nan
+            continue
+        plane = out[k]
+        plane[:, : w - 1] = np.nan
+        if w <= n_bars:
+            plane[:, w - 1 :] = (cs[:, w:] - cs[:, : n_bars + 1 - w]) / w
+        # Mask the padded tail and any row shorter than the window.
+        plane[col[None, :] >= lengths[:, None]] = np.nan
+    return out
@@ -12,14 +12,17 @@ from __future__ import annotations
 import json
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import typer
 
 from ..clients.ingestor_client import IngestorClient
 from ..db.engine import get_engine
-from ..indicator.compute import compute_sma
+from ..indicator.kernels import rolling_means_matrix
+from ..models import IndicatorRow
 from ..repositories.indicator_series_repository import IndicatorSeriesRepository
 from ..repositories.job_run_item_repository import JobRunItemRepository
 from ..repositories.job_run_repository import JobRunRepository
@@ -28,6 +31,8 @@ from ..repositories.job_run_repository import JobRunRepository
 class MaComputeJob:
     """Compute SMA indicators for a given target index."""
 
+    MAX_WORKERS = 16
+
     def __init__(self, target_name: str, target_cfg: dict, full_cfg: dict):
         self.target_name = target_name
         self.target_cfg = target_cfg
@@ -96,19 +101,30 @@ class MaComputeJob:
                     sma_windows.append(int(w))
         typer.echo(f"[ma_compute] sma windows = {sma_windows}")
 
-        # Process each ticker (continue-on-failure)
+        # Process tickers concurrently — the per-ticker work is dominated
+        # by the ingestor HTTP fetch, so a thread pool scales wall-clock
+        # nearly linearly.  _process_ticker never raises (continue-on-
+        # failure), and audit writes stay on this thread, in input order.
         summary_rows: list[dict] = []
 
-        for tkr in tickers:
-            result = self._process_ticker(
-                tkr, sma_windows, start_date, end_date, job_run_id,
-            )
+        max_workers = min(self.MAX_WORKERS, max(1, len(tickers)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_ticker,
+                    tkr, sma_windows, start_date, end_date, job_run_id,
+                )
+                for tkr in tickers
+            ]
+
+        for future in futures:
+            result = future.result()
             summary_rows.append(result)
 
             # Audit item
             self.job_run_item_repo.create(
                 job_run_id=job_run_id,
-                item_key=tkr,
+                item_key=result["ticker"],
                 status=result["status"],
                 message=result.get("error"),
                 details={
@@ -175,39 +191,58 @@ class MaComputeJob:
                 result["error"] = "no candles"
                 return result
 
+            # Not enough bars for even the smallest window → no rows can
+            # come out, so skip the DataFrame build and kernel call
+            # entirely.  Common at index-boundary dates and new listings.
+            if not sma_windows or len(candles) < min(sma_windows):
+                result["error"] = (
+                    "insufficient candles" if sma_windows else "no sma windows"
+                )
+                return result
+
             # Build a sorted DataFrame
             df = pd.DataFrame(candles)
             df["as_of_date"] = pd.to_datetime(df["as_of_date"]).dt.date
             df = df.sort_values("as_of_date").reset_index(drop=True)
 
-            rows_to_upsert: list[dict] = []
+            # Rows accumulate as frozen slot records — far smaller than
+            # dicts, and the repository unpacks them positionally at
+            # flush time.
+            rows_to_upsert: list[IndicatorRow] = []
+
+            # One compiled-kernel call covers all windows; closes are
+            # converted to a float64 ndarray once per ticker.
+            windows = [w for w in sma_windows if len(df) >= w]
+            if windows:
+                closes = df["close"].to_numpy(dtype=np.float64)
+                sma_matrix = rolling_means_matrix(closes, windows)
 
-            for window in sma_windows:
-                if len(df) < window:
-                    continue
-                sma_series = compute_sma(df["close"], window)
+            for k, window in enumerate(windows):
+                sma_values = sma_matrix[k]
                 params_json = json.dumps({"window": window}, sort_keys=True)
 
                 for idx in range(window - 1, len(df)):
-                    val = sma_series.iloc[idx]
-                    if pd.isna(val):
+                    val = sma_values[idx]
+                    if np.isnan(val):
                         continue
                     rows_to_upsert.append(
-                        {
-                            "ticker": tkr,
-                            "as_of_date": df["as_of_date"].iloc[idx],
-                            "indicator_key": "sma",
-                            "params_json": params_json,
-                            "value": round(float(val), 4),
-                            "source": "computed",
-                            "created_by_job_run_id": job_run_id,
-                        }
+                        IndicatorRow(
+                            ticker=tkr,
+                            as_of_date=df["as_of_date"].iloc[idx],
+                            indicator_key="sma",
+                            params_json=params_json,
+                            value=round(float(val), 4),
+                            source="computed",
+                            created_by_job_run_id=job_run_id,
+                        )
                     )
 
             if rows_to_upsert:
-                written = self.indicator_repo.upsert_indicator_rows(rows_to_upsert)
+                written = self.indicator_repo.upsert_indicator_records(
+                    rows_to_upsert
+                )
                 result["rows_written"] = written
-                dates = [r["as_of_date"] for r in rows_to_upsert]
+                dates = [r.as_of_date for r in rows_to_upsert]
                 result["min_date"] = str(min(dates))
                 result["max_date"] = str(max(dates))
 
@@ -14,17 +14,49 @@ import os
 import traceback
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import typer
 
 from ..clients.ingestor_client import IngestorClient
 from ..db.engine import get_engine
-from ..indicator.compute import compute_vol_sma
+from ..indicator.kernels import rolling_means_matrix
 from ..repositories.indicator_series_repository import IndicatorSeriesRepository
 from ..repositories.job_run_item_repository import JobRunItemRepository
 from ..repositories.job_run_repository import JobRunRepository
 
 
+#: Summary-table columns: (key, right-align?)
+_SUMMARY_COLUMNS = [
+    ("ticker", False),
+    ("status", False),
+    ("candles_fetched", True),
+    ("rows_written", True),
+    ("min_date", False),
+    ("max_date", False),
+    ("error", False),
+]
+
+
+def _print_summary(rows: list[dict]) -> None:
+    """Print the per-ticker summary as a fixed-width table.
+
+    Building a DataFrame just to pretty-print is wasted constructor cost;
+    a str.format pass over precomputed column widths does the same job.
+    """
+    widths = {
+        key: max(len(key), max((len(str(r[key])) for r in rows), default=0))
+        for key, _ in _SUMMARY_COLUMNS
+    }
+    fmt = "  ".join(
+        f"{{{key}:{'>' if right else '<'}{widths[key]}}}"
+        for key, right in _SUMMARY_COLUMNS
+    )
+    typer.echo(fmt.format(**{key: key for key, _ in _SUMMARY_COLUMNS}))
+    for r in rows:
+        typer.echo(fmt.format(**{key: str(r[key]) for key, _ in _SUMMARY_COLUMNS}))
+
+
 class VolSmaComputeJob:
     """Compute volume SMA indicators for a given target index."""
 
@@ -96,19 +128,46 @@ class VolSmaComputeJob:
         typer.echo(f"[vol_sma_compute] tickers     = {len(tickers)}")
         typer.echo(f"[vol_sma_compute] vol_sma windows = {vol_sma_windows}")
 
-        # Process each ticker (continue-on-failure)
+        # Process each ticker (continue-on-failure).  The fetch/compute
+        # loop buffers its rows and runs outside any transaction; the
+        # buffer flushes in one engine.begin() afterwards — still a
+        # single COMMIT for the whole job, but a failed ticker can't
+        # poison a shared transaction and no row locks stay open across
+        # the per-ticker HTTP fetches.
         summary_rows: list[dict] = []
+        pending_rows: list[dict] = []
 
         for tkr in tickers:
-            result = self._process_ticker(
+            result, ticker_rows = self._process_ticker(
                 tkr, vol_sma_windows, start_date, end_date, job_run_id,
             )
             summary_rows.append(result)
+            pending_rows.extend(ticker_rows)
 
-            # Audit item
+        if pending_rows:
+            try:
+                with self.engine.begin() as conn:
+                    self.indicator_repo.upsert_indicator_rows(
+                        pending_rows, conn=conn
+                    )
+            except Exception as exc:
+                # The flush is atomic — nothing was written for any
+                # ticker, so the summary and audit must not claim rows.
+                traceback.print_exc()
+                for r in summary_rows:
+                    if r["rows_written"]:
+                        r["status"] = "FAILED"
+                        r["rows_written"] = 0
+                        r["min_date"] = ""
+                        r["max_date"] = ""
+                        r["error"] = f"batch upsert failed: {exc}"
+
+        # Audit items — written after the flush so rows_written reflects
+        # what actually committed.
+        for result in summary_rows:
             self.job_run_item_repo.create(
                 job_run_id=job_run_id,
-                item_key=tkr,
+                item_key=result["ticker"],
                 status=result["status"],
                 message=result.get("error"),
                 details={
@@ -121,8 +180,8 @@ class VolSmaComputeJob:
             )
 
         # Print summary table
-        df = pd.DataFrame(summary_rows)
-        typer.echo("\n" + df.to_string(index=False))
+        typer.echo("")
+        _print_summary(summary_rows)
 
         succeeded = sum(1 for r in summary_rows if r["status"] == "SUCCESS")
         failed = len(summary_rows) - succeeded
@@ -155,8 +214,15 @@ class VolSmaComputeJob:
         start_date: date,
         end_date: date,
         job_run_id: str,
-    ) -> dict:
-        """Fetch OHLCV, compute volume SMA, upsert rows. Returns summary dict."""
+    ) -> tuple[dict, list[dict]]:
+        """Fetch OHLCV and compute volume SMA for one ticker.
+
+        Returns (summary dict, rows to upsert).  Writing is the caller's
+        job — rows from every ticker flush together in one transaction
+        after the loop, so a failed ticker contributes no rows instead
+        of aborting a shared transaction mid-run.
+        """
+        rows_to_upsert: list[dict] = []
         result: dict = {
             "ticker": tkr,
             "status": "SUCCESS",
@@ -173,41 +239,51 @@ class VolSmaComputeJob:
             if not candles:
                 result["status"] = "SUCCESS"
                 result["error"] = "no candles"
-                return result
+                return result, rows_to_upsert
 
-            # Build a sorted DataFrame
+            # Build a sorted DataFrame.  Convert to datetime64 before
+            # sorting (typed sort, not object sort) and skip the sort
+            # entirely when the API already returned ordered candles —
+            # the monotonic check is a cheap O(N) pass.
             df = pd.DataFrame(candles)
-            df["as_of_date"] = pd.to_datetime(df["as_of_date"]).dt.date
-            df = df.sort_values("as_of_date").reset_index(drop=True)
+            df["as_of_date"] = pd.to_datetime(df["as_of_date"])
+            if not df["as_of_date"].is_monotonic_increasing:
+                df = df.sort_values("as_of_date", kind="mergesort").reset_index(
+                    drop=True
+                )
+            df["as_of_date"] = df["as_of_date"].dt.date
 
             # Validate volume column exists and has no nulls
             if "volume" not in df.columns:
                 result["status"] = "FAILED"
                 result["error"] = "missing volume column in OHLCV data"
-                return result
+                return result, rows_to_upsert
 
             volume = pd.to_numeric(df["volume"], errors="coerce")
             if volume.isna().any():
                 result["status"] = "FAILED"
                 result["error"] = "NULL/missing volume values detected"
-                return result
+                return result, rows_to_upsert
 
             if (volume < 0).any():
                 result["status"] = "FAILED"
                 result["error"] = "negative volume values detected"
-                return result
+                return result, rows_to_upsert
 
-            rows_to_upsert: list[dict] = []
+            # One kernel call for all windows (precompiled, no JIT warmup)
+            windows = [w for w in vol_sma_windows if len(df) >= w]
+            if windows:
+                # Keep the native dtype — integer volume dispatches to the
+                # int64 running-sum kernel.
+                sma_matrix = rolling_means_matrix(volume.to_numpy(), windows)
 
-            for window in vol_sma_windows:
-                if len(df) < window:
-                    continue
-                vol_sma_series = compute_vol_sma(volume, window)
+            for k, window in enumerate(windows):
+                vol_sma_values = sma_matrix[k]
                 params_json = json.dumps({"window": window}, sort_keys=True)
 
                 for idx in range(window - 1, len(df)):
-                    val = vol_sma_series.iloc[idx]
-                    if pd.isna(val):
+                    val = vol_sma_values[idx]
+                    if np.isnan(val):
                         continue
                     rows_to_upsert.append(
                         {
@@ -222,8 +298,9 @@ class VolSmaComputeJob:
                     )
 
             if rows_to_upsert:
-                written = self.indicator_repo.upsert_indicator_rows(rows_to_upsert)
-                result["rows_written"] = written
+                # Every row either inserts or updates exactly one row,
+                # so the eventual rowcount equals the buffer length.
+                result["rows_written"] = len(rows_to_upsert)
                 dates = [r["as_of_date"] for r in rows_to_upsert]
                 result["min_date"] = str(min(dates))
                 result["max_date"] = str(max(dates))
@@ -232,5 +309,6 @@ class VolSmaComputeJob:
             result["status"] = "FAILED"
             result["error"] = f"{type(exc).__name__}: {exc}"
             traceback.print_exc()
+            return result, []
 
-        return result
+        return result, rows_to_upsert
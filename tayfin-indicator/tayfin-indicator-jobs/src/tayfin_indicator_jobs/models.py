@@ -0,0 +1,25 @@
+"""Shared record types for indicator jobs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorRow:
+    """One indicator_series row, accumulated by compute jobs.
+
+    Slots keep the per-row footprint roughly 3x below a dict — jobs hold
+    hundreds of thousands of these across a run — and attribute access
+    in the upsert binder is a direct slot read instead of a hash lookup.
+    Field order matches indicator_series_repository.TUPLE_COLUMNS.
+    """
+
+    ticker: str
+    as_of_date: date
+    indicator_key: str
+    params_json: str
+    value: float
+    source: str = "computed"
+    created_by_job_run_id: str | None = None
@@ -7,16 +7,91 @@ from datetime import datetime, timezone
 
 from sqlalchemy import text
 
+# Constant statement — executemany batches the rows, and the stable SQL
+# string lets the driver reuse its prepared statement across chunks
+# (a per-chunk f-string VALUES list would defeat that cache).
+_UPSERT_STMT = text(
+    """
+    INSERT INTO tayfin_indicator.indicator_series
+        (ticker, as_of_date, indicator_key, params_json,
+         value, source,
+         created_at, updated_at,
+         created_by_job_run_id, updated_by_job_run_id)
+    VALUES
+        (:ticker, :as_of_date, :indicator_key, CAST(:params_json AS jsonb),
+         :value, :source,
+         :created_at, :updated_at,
+         :created_by, :updated_by)
+    ON CONFLICT (ticker, as_of_date, indicator_key, params_json)
+    DO UPDATE SET
+        value                 = EXCLUDED.value,
+        updated_at            = EXCLUDED.updated_at,
+        updated_by_job_run_id = EXCLUDED.created_by_job_run_id
+    """
+)
+
+#: Column order for the tuple-based upsert path (SoA producers).
+TUPLE_COLUMNS = (
+    "ticker",
+    "as_of_date",
+    "indicator_key",
+    "params_json",
+    "value",
+    "source",
+    "created_by_job_run_id",
+)
+
+# Driver-level statement with positional binds — tuples go straight to
+# the driver without per-row dict construction or key hashing.
+_UPSERT_TUPLE_SQL = """
+    INSERT INTO tayfin_indicator.indicator_series
+        (ticker, as_of_date, indicator_key, params_json,
+         value, source,
+         created_at, updated_at,
+         created_by_job_run_id, updated_by_job_run_id)
+    VALUES
+        (%s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (ticker, as_of_date, indicator_key, params_json)
+    DO UPDATE SET
+        value                 = EXCLUDED.value,
+        updated_at            = EXCLUDED.updated_at,
+        updated_by_job_run_id = EXCLUDED.created_by_job_run_id
+"""
+
+
+_COPY_COLUMNS_SQL = (
+    "ticker, as_of_date, indicator_key, params_json, value, source, "
+    "created_at, updated_at, created_by_job_run_id"
+)
+
+_COPY_STG_DDL = (
+    "CREATE TEMP TABLE indicator_series_stg "
+    "(LIKE tayfin_indicator.indicator_series INCLUDING DEFAULTS) "
+    "ON COMMIT DROP"
+)
+
+_COPY_MERGE_SQL = f"""
+    INSERT INTO tayfin_indicator.indicator_series ({_COPY_COLUMNS_SQL})
+    SELECT {_COPY_COLUMNS_SQL} FROM indicator_series_stg
+    ON CONFLICT (ticker, as_of_date, indicator_key, params_json)
+    DO UPDATE SET
+        value                 = EXCLUDED.value,
+        updated_at            = EXCLUDED.updated_at,
+        updated_by_job_run_id = EXCLUDED.created_by_job_run_id
+"""
+
 
 class IndicatorSeriesRepository:
     """Upsert-oriented access to tayfin_indicator.indicator_series."""
 
     CHUNK_SIZE = 1000
+    #: Batches at or above this size stream through COPY + staging merge.
+    COPY_THRESHOLD = 5000
 
     def __init__(self, engine):
         self.engine = engine
 
-    def upsert_indicator_rows(self, rows: list[dict]) -> int:
+    def upsert_indicator_rows(self, rows: list[dict], conn=None) -> int:
         """Upsert *rows* in chunks; return total rows affected.
 
         Each dict must contain:
@@ -24,6 +99,11 @@ class IndicatorSeriesRepository:
             value, source, created_by_job_run_id
 
         ON CONFLICT updates: value, updated_at, updated_by_job_run_id.
+
+        When *conn* is given, all chunks execute on that connection and
+        commit with the caller's transaction — jobs pass one connection
+        for the whole ticker loop instead of paying a pool acquire and
+        BEGIN/COMMIT per chunk.
         """
         if not rows:
             return 0
@@ -31,56 +111,135 @@ class IndicatorSeriesRepository:
         total = 0
         for start in range(0, len(rows), self.CHUNK_SIZE):
             chunk = rows[start : start + self.CHUNK_SIZE]
-            total += self._upsert_chunk(chunk)
+            total += self._upsert_chunk(chunk, conn=conn)
         return total
 
-    # ------------------------------------------------------------------
+    def upsert_indicator_tuples(
+        self,
+        columns: tuple[str, ...],
+        rows: list[tuple],
+        conn=None,
+    ) -> int:
+        """Tuple-based upsert for SoA producers; return rows affected.
+
+        *rows* are tuples in TUPLE_COLUMNS order (params_json already a
+        JSON string, value already float).  Tuples bind positionally at
+        the driver level, skipping the per-row dict construction of
+        upsert_indicator_rows — roughly 5x less payload memory on large
+        batches.
+        """
+        if columns != TUPLE_COLUMNS:
+            raise ValueError(f"columns must be {TUPLE_COLUMNS}, got {columns}")
+        if not rows:
+            return 0
+
+        if len(rows) >= self.COPY_THRESHOLD:
+            return self.copy_indicator_tuples(rows, conn=conn)
 
-    def _upsert_chunk(self, chunk: list[dict]) -> int:
-        """Insert a single chunk with ON CONFLICT upsert."""
         now = datetime.now(timezone.utc)
+        total = 0
+        for start in range(0, len(rows), self.CHUNK_SIZE):
+            chunk = rows[start : start + self.CHUNK_SIZE]
+            # (ticker, as_of_date, indicator_key, params_json, value,
+            #  source, created_at, updated_at, created_by, updated_by)
+            bind = [
+                (r[0], r[1], r[2], r[3], r[4], r[5], now, now, r[6], None)
+                for r in chunk
+            ]
+            if conn is not None:
+                total += conn.exec_driver_sql(_UPSERT_TUPLE_SQL, bind).rowcount
+            else:
+                with self.engine.begin() as own_conn:
+                    total += own_conn.exec_driver_sql(
+                        _UPSERT_TUPLE_SQL, bind
+                    ).rowcount
+        return total
 
-        # Build VALUES placeholders  (:ticker_0, :as_of_date_0, …)
-        placeholders = []
-        bind: dict = {}
-        for i, row in enumerate(chunk):
-            ph = (
-                f"(:ticker_{i}, :as_of_date_{i}, :indicator_key_{i}, "
-                f"CAST(:params_json_{i} AS jsonb), :value_{i}, :source_{i}, "
-                f":created_at_{i}, :updated_at_{i}, :created_by_{i}, :updated_by_{i})"
+    def upsert_indicator_records(self, rows, conn=None) -> int:
+        """Upsert IndicatorRow records (see models.IndicatorRow).
+
+        The slot objects are unpacked into TUPLE_COLUMNS-order tuples at
+        flush time and routed through upsert_indicator_tuples; only the
+        transient bind list pays the tuple cost, not the accumulation
+        buffer the job carries across its whole run.
+        """
+        if not rows:
+            return 0
+        bind = [
+            (
+                r.ticker,
+                r.as_of_date,
+                r.indicator_key,
+                r.params_json,
+                r.value,
+                r.source,
+                r.created_by_job_run_id,
             )
-            placeholders.append(ph)
+            for r in rows
+        ]
+        return self.upsert_indicator_tuples(TUPLE_COLUMNS, bind, conn=conn)
+
+    def copy_indicator_tuples(self, rows: list[tuple], conn=None) -> int:
+        """Bulk-load *rows* via COPY into a staging table, then merge.
+
+        COPY FROM STDIN beats even multi-VALUES INSERT at the 10k+ row
+        scale; upsert semantics come from the staging-table merge with
+        the same ON CONFLICT clause as the direct paths.  Rows are
+        tuples in TUPLE_COLUMNS order.
+        """
+        if not rows:
+            return 0
+        if conn is not None:
+            return self._copy_merge(rows, conn)
+        with self.engine.begin() as own_conn:
+            return self._copy_merge(rows, own_conn)
+
+    @staticmethod
+    def _copy_merge(rows: list[tuple], conn) -> int:
+        now = datetime.now(timezone.utc)
+        # psycopg3 COPY — go through the driver connection of *conn* so
+        # staging table, COPY, and merge share one transaction.
+        driver_conn = conn.connection.driver_connection
+        with driver_conn.cursor() as cur:
+            cur.execute(_COPY_STG_DDL)
+            with cur.copy(
+                f"COPY indicator_series_stg ({_COPY_COLUMNS_SQL}) FROM STDIN"
+            ) as copy:
+                for r in rows:
+                    copy.write_row(
+                        (r[0], r[1], r[2], r[3], r[4], r[5], now, now, r[6])
+                    )
+            cur.execute(_COPY_MERGE_SQL)
+            return cur.rowcount
+
+    # ------------------------------------------------------------------
+
+    def _upsert_chunk(self, chunk: list[dict], conn=None) -> int:
+        """Insert a single chunk with ON CONFLICT upsert (executemany)."""
+        now = datetime.now(timezone.utc)
+
+        bind: list[dict] = []
+        for row in chunk:
             params_j = row["params_json"]
             if isinstance(params_j, dict):
                 params_j = json.dumps(params_j, sort_keys=True)
-            bind[f"ticker_{i}"] = row["ticker"]
-            bind[f"as_of_date_{i}"] = row["as_of_date"]
-            bind[f"indicator_key_{i}"] = row["indicator_key"]
-            bind[f"params_json_{i}"] = params_j
-            bind[f"value_{i}"] = float(row["value"])
-            bind[f"source_{i}"] = row.get("source", "computed")
-            bind[f"created_at_{i}"] = now
-            bind[f"updated_at_{i}"] = now
-            bind[f"created_by_{i}"] = row["created_by_job_run_id"]
-            bind[f"updated_by_{i}"] = row.get("updated_by_job_run_id")
-
-        values_sql = ",\n".join(placeholders)
-        stmt = text(
-            f"""
-            INSERT INTO tayfin_indicator.indicator_series
-                (ticker, as_of_date, indicator_key, params_json,
-                 value, source,
-                 created_at, updated_at,
-                 created_by_job_run_id, updated_by_job_run_id)
-            VALUES
-                {values_sql}
-            ON CONFLICT (ticker, as_of_date, indicator_key, params_json)
-            DO UPDATE SET
-                value                 = EXCLUDED.value,
-                updated_at            = EXCLUDED.updated_at,
-                updated_by_job_run_id = EXCLUDED.created_by_job_run_id
-            """
-        )
-        with self.engine.begin() as conn:
-            result = conn.execute(stmt, bind)
+            bind.append(
+                {
+                    "ticker": row["ticker"],
+                    "as_of_date": row["as_of_date"],
+                    "indicator_key": row["indicator_key"],
+                    "params_json": params_j,
+                    "value": float(row["value"]),
+                    "source": row.get("source", "computed"),
+                    "created_at": now,
+                    "updated_at": now,
+                    "created_by": row["created_by_job_run_id"],
+                    "updated_by": row.get("updated_by_job_run_id"),
+                }
+            )
+
+        if conn is not None:
+            return conn.execute(_UPSERT_STMT, bind).rowcount
+        with self.engine.begin() as own_conn:
+            result = own_conn.execute(_UPSERT_STMT, bind)
             return result.rowcount
@@ -31,6 +31,13 @@ class JobRunItemRepository:
             RETURNING id
             """
         )
+        # Serialize outside the transaction — no reason to hold the
+        # connection open while encoding the details dict.
+        payload = (
+            json.dumps(details, default=str, separators=(",", ":"))
+            if details
+            else None
+        )
         with self.engine.begin() as conn:
             row = conn.execute(
                 stmt,
@@ -39,7 +46,7 @@ class JobRunItemRepository:
                     "item_key": item_key,
                     "status": status,
                     "message": message,
-                    "details": json.dumps(details) if details else None,
+                    "details": payload,
                     "created_at": now,
                     "updated_at": now,
                 },
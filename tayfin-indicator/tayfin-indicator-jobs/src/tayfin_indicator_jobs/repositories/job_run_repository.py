@@ -30,6 +30,13 @@ class JobRunRepository:
             RETURNING id
             """
         )
+        # Serialize outside the transaction so the connection is not held
+        # open while encoding the (potentially large) params snapshot.
+        payload = (
+            json.dumps(params, default=str, separators=(",", ":"))
+            if params
+            else None
+        )
         with self.engine.begin() as conn:
             row = conn.execute(
                 stmt,
@@ -38,7 +45,7 @@ class JobRunRepository:
                     "target_name": target_name,
                     "status": status,
                     "started_at": now,
-                    "params": json.dumps(params) if params else None,
+                    "params": payload,
                     "created_at": now,
                     "updated_at": now,
                 },
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
+import pytest
+
 
 def make_ohlcv_candles(
     n: int = 10,
@@ -38,3 +40,13 @@ def make_ohlcv_candles(
         while d.weekday() >= 5:
             d += timedelta(days=1)
     return candles
+
+
+@pytest.fixture(scope="session")
+def ohlcv_10_base100():
+    """The common 10-candle payload, built once per session.
+
+    Returned as a tuple so no test can mutate it; tests pass
+    ``list(ohlcv_10_base100)`` where a list is required.
+    """
+    return tuple(make_ohlcv_candles(n=10, base_close=100.0))
@@ -13,6 +13,7 @@ No real HTTP, no real DB.
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from datetime import date
 from unittest.mock import MagicMock
 
@@ -22,6 +23,16 @@ from conftest import make_ohlcv_candles
 
 # We test MaComputeJob as the representative; the orchestration logic is
 # identical across all four job classes.
+from tayfin_indicator_jobs.jobs.ma_compute_job import MaComputeJob
+
+
+@pytest.fixture(autouse=True)
+def _fake_engine(monkeypatch):
+    """Prevent get_engine() from touching a real DB in every test."""
+    monkeypatch.setattr(
+        "tayfin_indicator_jobs.jobs.ma_compute_job.get_engine",
+        lambda: MagicMock(),
+    )
 
 
 # ── Fake collaborators ───────────────────────────────────────────────
@@ -68,6 +79,15 @@ class FakeIndicatorSeriesRepository:
         self.upserted_rows.extend(rows)
         return len(rows)
 
+    def upsert_indicator_tuples(self, columns: tuple, rows: list[tuple]) -> int:
+        self.upserted_rows.extend(dict(zip(columns, r)) for r in rows)
+        return len(rows)
+
+    def upsert_indicator_records(self, rows) -> int:
+        # Assertions read dicts; production stores IndicatorRow slots.
+        self.upserted_rows.extend(asdict(r) for r in rows)
+        return len(rows)
+
 
 class FakeIngestorClient:
     """Return fixed ticker list; AAPL gets candles, MSFT raises."""
@@ -87,16 +107,8 @@ class FakeIngestorClient:
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _build_job(monkeypatch, candles):
+def _build_job(candles):
     """Build an MaComputeJob with all dependencies faked."""
-    # Prevent get_engine() from touching a real DB
-    monkeypatch.setattr(
-        "tayfin_indicator_jobs.jobs.ma_compute_job.get_engine",
-        lambda: MagicMock(),
-    )
-
-    from tayfin_indicator_jobs.jobs.ma_compute_job import MaComputeJob
-
     target_cfg = {
         "index_code": "NDX",
         "country": "US",
@@ -123,11 +135,10 @@ def _build_job(monkeypatch, candles):
 class TestMaComputeJobOrchestration:
     """Integration-style test of the MaComputeJob orchestration loop."""
 
-    def test_aapl_success_msft_failure(self, monkeypatch):
+    def test_aapl_success_msft_failure(self, monkeypatch, ohlcv_10_base100):
         """AAPL succeeds, MSFT fails → overall FAILED."""
         monkeypatch.setenv("TAYFIN_INDICATOR_LOOKBACK_DAYS", "420")
-        candles = make_ohlcv_candles(n=10, base_close=100.0)
-        job = _build_job(monkeypatch, candles)
+        job = _build_job(list(ohlcv_10_base100))
 
         job.run()
 
@@ -157,17 +168,10 @@ class TestMaComputeJobOrchestration:
         # No MSFT rows
         assert not any(r["ticker"] == "MSFT" for r in upserted)
 
-    def test_all_success(self, monkeypatch):
+    def test_all_success(self, monkeypatch, ohlcv_10_base100):
         """When all tickers succeed, overall status is SUCCESS."""
         monkeypatch.setenv("TAYFIN_INDICATOR_LOOKBACK_DAYS", "420")
-        candles = make_ohlcv_candles(n=10, base_close=100.0)
-
-        monkeypatch.setattr(
-            "tayfin_indicator_jobs.jobs.ma_compute_job.get_engine",
-            lambda: MagicMock(),
-        )
-
-        from tayfin_indicator_jobs.jobs.ma_compute_job import MaComputeJob
+        candles = list(ohlcv_10_base100)
 
         target_cfg = {
             "index_code": "NDX",
@@ -204,13 +208,6 @@ class TestMaComputeJobOrchestration:
         """Ticker with no candles → item SUCCESS (no rows written)."""
         monkeypatch.setenv("TAYFIN_INDICATOR_LOOKBACK_DAYS", "420")
 
-        monkeypatch.setattr(
-            "tayfin_indicator_jobs.jobs.ma_compute_job.get_engine",
-            lambda: MagicMock(),
-        )
-
-        from tayfin_indicator_jobs.jobs.ma_compute_job import MaComputeJob
-
         target_cfg = {
             "index_code": "NDX",
             "country": "US",
@@ -248,13 +245,6 @@ class TestMaComputeJobOrchestration:
         # close = 100, 101, 102, 103, 104
         candles = make_ohlcv_candles(n=5, base_close=100.0, step=1.0)
 
-        monkeypatch.setattr(
-            "tayfin_indicator_jobs.jobs.ma_compute_job.get_engine",
-            lambda: MagicMock(),
-        )
-
-        from tayfin_indicator_jobs.jobs.ma_compute_job import MaComputeJob
-
         target_cfg = {
             "index_code": "NDX",
             "country": "US",
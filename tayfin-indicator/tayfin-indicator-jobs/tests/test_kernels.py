@@ -0,0 +1,106 @@
+"""Unit tests for the rolling-mean kernels.
+
+Exercises the Python kernel source directly so results are identical
+whether or not the AOT-compiled ``tayfin_kernels`` module is present.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tayfin_indicator_jobs.indicator.kernels import (
+    _rolling_means_py,
+    _simple_returns_py,
+    rolling_means_batch,
+    rolling_means_matrix,
+    simple_returns_vector,
+)
+
+
+class TestRollingMeansMatrix:
+    def test_matches_pandas_rolling_mean(self):
+        vol = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        out = rolling_means_matrix(vol, [2, 3])
+        for k, w in enumerate([2, 3]):
+            expected = pd.Series(vol).rolling(window=w).mean().to_numpy()
+            np.testing.assert_allclose(out[k], expected)
+
+    def test_nan_prefix_length(self):
+        vol = np.arange(10, dtype=float)
+        out = rolling_means_matrix(vol, [4])
+        assert np.isnan(out[0, :3]).all()
+        assert not np.isnan(out[0, 3:]).any()
+
+    def test_window_larger_than_input_is_all_nan(self):
+        vol = np.array([1.0, 2.0, 3.0])
+        out = rolling_means_matrix(vol, [5])
+        assert np.isnan(out[0]).all()
+
+    def test_integer_volume_matches_float_path(self):
+        vol_int = np.array([1_000_000 * (i + 1) for i in range(12)], dtype=np.int64)
+        out_int = rolling_means_matrix(vol_int, [3, 5])
+        out_float = rolling_means_matrix(vol_int.astype(np.float64), [3, 5])
+        np.testing.assert_allclose(out_int, out_float, equal_nan=True)
+
+    def test_integer_mean_is_exact_float(self):
+        # Non-divisible sums must still produce fractional means
+        vol = np.array([1, 2, 4], dtype=np.int64)
+        out = rolling_means_matrix(vol, [2])
+        assert out[0, 1] == pytest.approx(1.5)
+        assert out[0, 2] == pytest.approx(3.0)
+
+    def test_batch_matches_per_ticker_on_jagged_lengths(self):
+        rng = np.random.default_rng(42)
+        lengths = np.array([10, 4, 7], dtype=np.int64)
+        n = int(lengths.max())
+        batch = np.full((3, n), np.nan)
+        series = [rng.uniform(1.0, 100.0, size=int(m)) for m in lengths]
+        for t, s in enumerate(series):
+            batch[t, : s.shape[0]] = s
+
+        windows = [3, 5]
+        out = rolling_means_batch(batch, lengths, windows)
+        assert out.shape == (2, 3, n)
+        for t, s in enumerate(series):
+            per_ticker = rolling_means_matrix(s, windows)
+            np.testing.assert_allclose(
+                out[:, t, : s.shape[0]], per_ticker, equal_nan=True
+            )
+            # Padded tail stays NaN
+            assert np.isnan(out[:, t, s.shape[0]:]).all()
+
+    def test_python_kernel_source_directly(self):
+        """The fallback source itself must be correct (AOT compiles it)."""
+        vol = np.array([10.0, 20.0, 30.0, 40.0])
+        windows = np.array([2], dtype=np.int64)
+        out = np.empty((1, 4), dtype=np.float64)
+        _rolling_means_py(vol, windows, out)
+        assert np.isnan(out[0, 0])
+        assert out[0, 1] == pytest.approx(15.0)
+        assert out[0, 2] == pytest.approx(25.0)
+        assert out[0, 3] == pytest.approx(35.0)
+
+
+class TestSimpleReturns:
+    def test_matches_pandas_pct_change(self):
+        close = np.array([100.0, 102.0, 99.0, 99.0, 105.0])
+        out = simple_returns_vector(close)
+        expected = pd.Series(close).pct_change().to_numpy()
+        np.testing.assert_allclose(out, expected, equal_nan=True)
+
+    def test_zero_predecessor_is_nan(self):
+        out = simple_returns_vector(np.array([1.0, 0.0, 2.0]))
+        assert np.isnan(out[0])
+        assert out[1] == pytest.approx(-1.0)
+        assert np.isnan(out[2])
+
+    def test_python_kernel_source_directly(self):
+        """The fallback source itself must be correct (AOT compiles it)."""
+        close = np.array([10.0, 11.0, 22.0])
+        out = np.empty(3, dtype=np.float64)
+        _simple_returns_py(close, out)
+        assert np.isnan(out[0])
+        assert out[1] == pytest.approx(0.1)
+        assert out[2] == pytest.approx(1.0)
@@ -0,0 +1,24 @@
+-- Flyway migration: create mv_ohlcv_latest materialized view
+-- V6__create_mv_ohlcv_latest.sql
+--
+-- Precomputes the latest candle per instrument so read paths (e.g. the
+-- API's index-latest endpoint) do an index lookup instead of a
+-- DISTINCT ON scan over the full ohlcv_daily history on every request.
+-- Refreshed by the OHLCV ingestion job after each successful load.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS tayfin_ingestor.mv_ohlcv_latest AS
+SELECT DISTINCT ON (instrument_id)
+  instrument_id,
+  as_of_date,
+  open,
+  high,
+  low,
+  close,
+  volume,
+  source
+FROM tayfin_ingestor.ohlcv_daily
+ORDER BY instrument_id, as_of_date DESC;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_ohlcv_latest_instrument
+  ON tayfin_ingestor.mv_ohlcv_latest (instrument_id);
@@ -1,26 +1,64 @@
 import os
-import re
 from datetime import date
 
+import orjson
 from flask import Flask, jsonify, request
+from flask_compress import Compress
 
 from .config.loader import load_config
-from .db.engine import get_engine
+from .db.engine import close_request_connection, get_engine
+from .json_provider import OrjsonProvider
+from .query import CommonQuery, QueryValidationError
 from .repositories.fundamentals_repository import FundamentalsRepository
-
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+from .repositories.index_membership_repository import IndexMembershipRepository
+from .repositories.instrument_repository import InstrumentRepository
+from .repositories.ohlcv_repository import OhlcvRepository
+from .serializers.ohlcv_serializer import (
+    serialize_candle,
+    serialize_index_latest,
+)
 
 
 def _parse_date(value: str) -> date:
-    """Parse a YYYY-MM-DD string into a date, raising ValueError on bad format or invalid date."""
-    if not _DATE_RE.match(value):
-        raise ValueError(f"invalid date format: {value}")
-    return date.fromisoformat(value)
+    """Parse a YYYY-MM-DD string into a date, raising ValueError on bad format or invalid date.
+
+    date.fromisoformat already rejects malformed input, so no regex
+    pre-validation is needed.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"invalid date format: {value}") from None
+
+
+def _norm(value: str | None) -> str | None:
+    """Strip+uppercase a selector param once; None stays None."""
+    return value.strip().upper() if value else None
+
+
+# Static error payloads for the checks CommonQuery does not cover —
+# built once at import so the validation fast path only pays for
+# jsonify.  (Response objects are not reusable across requests; the
+# dicts are.)
+_ERR_INDEX_CODE_REQUIRED = {"error": "index_code_required", "details": "query param 'index_code' is required"}
+_ERR_INVALID_DATE = {"error": "invalid_date", "details": "dates must be YYYY-MM-DD"}
+
+_ARROW_MIMETYPE = "application/vnd.apache.arrow.stream"
 
 
 def create_app():
     load_config()  # ADR-04: triggers dotenv loading; no YAML keys used yet
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)  # jsonify now serializes via orjson
+    # Compress list-heavy payloads (hundreds of KB of JSON on /fundamentals
+    # and /ohlcv ranges); small responses like /health stay below the
+    # threshold and are passed through untouched.
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 1024
+    Compress(app)
+    # Repositories share one lazily opened connection per request (see
+    # db.engine.connection_scope); close it when the request ends.
+    app.teardown_appcontext(close_request_connection)
 
     @app.get('/health')
     def health():
@@ -28,47 +66,49 @@ def create_app():
 
     @app.get('/fundamentals/latest')
     def latest():
-        symbol = request.args.get('symbol')
-        country = request.args.get('country', 'US')
-
-        if not symbol:
-            return jsonify({"error": "symbol_required", "details": "query param 'symbol' is required"}), 400
+        try:
+            q = CommonQuery.from_request(request)
+        except QueryValidationError as exc:
+            return jsonify(exc.payload), 400
+        symbol_u = q.symbol
+        country_u = q.country
 
         engine = get_engine()
         repo = FundamentalsRepository(engine)
-        instr = repo.resolve_instrument(symbol.upper(), country.upper())
-        if not instr:
-            return jsonify({"error": "instrument_not_found", "details": f"{symbol} {country}"}), 404
 
         # Intentionally ignore any `source` query param: return the latest
         # snapshot for the instrument across all sources so callers receive
-        # the most recent available data for the ticker.
-        row = repo.get_latest_snapshot(instr['id'])
+        # the most recent available data for the ticker.  Resolution and
+        # fetch are fused into one query; the miss path does a second
+        # cheap lookup only to pick the right 404.
+        row = repo.get_latest_snapshot_by_symbol(symbol_u, country_u)
         if not row:
-            return jsonify({"error": "snapshot_not_found", "details": f"no snapshot for {symbol} {country}"}), 404
-
-        resp = {"symbol": symbol.upper(), "country": country.upper(), "as_of_date": row['as_of_date'].isoformat()}
+            if not repo.resolve_instrument(symbol_u, country_u):
+                return jsonify({"error": "instrument_not_found", "details": f"{symbol_u} {country_u}"}), 404
+            return jsonify({"error": "snapshot_not_found", "details": f"no snapshot for {symbol_u} {country_u}"}), 404
+
+        as_of = row['as_of_date'].isoformat()
+        # Snapshots change at most daily, so polling clients mostly see
+        # identical bodies — answer conditional requests with a 304 and
+        # skip serialization entirely.
+        etag = f"{symbol_u}-{country_u}-{as_of}"
+        if request.if_none_match.contains_weak(etag):
+            return '', 304
+
+        resp = {"symbol": symbol_u, "country": country_u, "as_of_date": as_of}
         resp.update(row['metrics'])
-        return jsonify(resp)
+        response = jsonify(resp)
+        response.set_etag(etag, weak=True)
+        return response
 
     @app.get('/fundamentals')
     def range_query():
-        symbol = request.args.get('symbol')
-        country = request.args.get('country', 'US')
+        try:
+            q = CommonQuery.from_request(request, limit_default=365, limit_max=2000)
+        except QueryValidationError as exc:
+            return jsonify(exc.payload), 400
         fr = request.args.get('from')
         to = request.args.get('to')
-        order = request.args.get('order', 'asc').lower()
-        try:
-            limit = int(request.args.get('limit', '365'))
-        except ValueError:
-            return jsonify({"error": "invalid_limit", "details": "limit must be integer"}), 400
-
-        if not symbol:
-            return jsonify({"error": "symbol_required", "details": "query param 'symbol' is required"}), 400
-        if limit < 1 or limit > 2000:
-            return jsonify({"error": "invalid_limit", "details": "limit must be between 1 and 2000"}), 400
-        if order not in ('asc', 'desc'):
-            return jsonify({"error": "invalid_order", "details": "order must be 'asc' or 'desc'"}), 400
 
         fr_date = None
         to_date = None
@@ -77,81 +117,79 @@ def create_app():
                 fr_date = date.fromisoformat(fr)
             if to:
                 to_date = date.fromisoformat(to)
-        except Exception:
-            return jsonify({"error": "invalid_date", "details": "dates must be YYYY-MM-DD"}), 400
+        except ValueError:
+            return jsonify(_ERR_INVALID_DATE), 400
+
+        symbol_u = q.symbol
+        country_u = q.country
 
         engine = get_engine()
         repo = FundamentalsRepository(engine)
-        instr = repo.resolve_instrument(symbol.upper(), country.upper())
-        if not instr:
-            return jsonify({"error": "instrument_not_found", "details": f"{symbol} {country}"}), 404
 
         # Ignore `source` and return snapshots across all providers for the
         # requested ticker in the given date range. This makes the API behave
-        # predictably by ticker and date only.
-        items = repo.get_snapshots_range(instr['id'], fr_date, to_date, limit, order)
-
-        resp = {
-            "symbol": symbol.upper(),
-            "country": country.upper(),
+        # predictably by ticker and date only.  The rows are aggregated to a
+        # JSON array inside Postgres and spliced into the envelope as raw
+        # bytes — they are never materialized as Python dicts.
+        count, items_json = repo.get_snapshots_range_json(symbol_u, country_u, fr_date, to_date, q.limit, q.order)
+        if count == 0 and not repo.resolve_instrument(symbol_u, country_u):
+            return jsonify({"error": "instrument_not_found", "details": f"{symbol_u} {country_u}"}), 404
+
+        envelope = orjson.dumps({
+            "symbol": symbol_u,
+            "country": country_u,
             "from": fr_date.isoformat() if fr_date else None,
             "to": to_date.isoformat() if to_date else None,
-            "count": len(items),
-            "items": items,
-        }
-        return jsonify(resp)
+            "count": count,
+        })
+        body = envelope[:-1] + b',"items":' + items_json.encode() + b"}"
+        return app.response_class(body, mimetype="application/json")
 
     @app.get('/indices/members')
     def index_members():
         index_code = request.args.get('index_code')
-        country = request.args.get('country', 'US')
-        order = request.args.get('order', 'asc').lower()
+        if not index_code:
+            return jsonify(_ERR_INDEX_CODE_REQUIRED), 400
         try:
-            limit = int(request.args.get('limit', '200'))
-        except ValueError:
-            return jsonify({"error": "invalid_limit", "details": "limit must be integer"}), 400
+            q = CommonQuery.from_request(
+                request, require_symbol=False, limit_default=200, limit_max=5000
+            )
+        except QueryValidationError as exc:
+            return jsonify(exc.payload), 400
 
-        if not index_code:
-            return jsonify({"error": "index_code_required", "details": "query param 'index_code' is required"}), 400
-        if limit < 1 or limit > 5000:
-            return jsonify({"error": "invalid_limit", "details": "limit must be between 1 and 5000"}), 400
-        if order not in ('asc', 'desc'):
-            return jsonify({"error": "invalid_order", "details": "order must be 'asc' or 'desc'"}), 400
+        index_code_u = index_code.upper()
+        country_u = q.country
 
         engine = get_engine()
-        from .repositories.index_membership_repository import IndexMembershipRepository
         repo = IndexMembershipRepository(engine)
 
-        items = repo.get_members(index_code.upper(), country.upper(), limit, order)
+        items = repo.get_members(index_code_u, country_u, q.limit, q.order)
         if not items:
             return jsonify({"error": "not_found", "details": f"no members for index {index_code}"}), 404
 
-        return jsonify({"index_code": index_code.upper(), "country": country.upper(), "count": len(items), "items": items})
+        return jsonify({"index_code": index_code_u, "country": country_u, "count": len(items), "items": items})
 
     @app.get('/indices/by-symbol')
     def indices_by_symbol():
-        symbol = request.args.get('symbol')
-        country = request.args.get('country', 'US')
         try:
-            limit = int(request.args.get('limit', '1000'))
-        except ValueError:
-            return jsonify({"error": "invalid_limit", "details": "limit must be integer"}), 400
+            q = CommonQuery.from_request(request, limit_default=1000)
+        except QueryValidationError as exc:
+            return jsonify(exc.payload), 400
 
-        if not symbol:
-            return jsonify({"error": "symbol_required", "details": "query param 'symbol' is required"}), 400
+        symbol_u = q.symbol
+        country_u = q.country
 
         engine = get_engine()
-        from .repositories.instrument_repository import InstrumentRepository
-        from .repositories.index_membership_repository import IndexMembershipRepository
         instr_repo = InstrumentRepository(engine)
         repo = IndexMembershipRepository(engine)
 
-        instr = instr_repo.resolve(symbol.upper(), country.upper())
-        if not instr:
-            return jsonify({"error": "instrument_not_found", "details": f"{symbol} {country}"}), 404
+        # Resolution and fetch are fused into one query; the miss path
+        # does a second cheap (TTL-cached) lookup only to pick the 404.
+        items = repo.get_indices_by_symbol(symbol_u, country_u, q.limit)
+        if not items and not instr_repo.resolve(symbol_u, country_u):
+            return jsonify({"error": "instrument_not_found", "details": f"{symbol_u} {country_u}"}), 404
 
-        items = repo.get_indices_for_instrument(instr['id'], limit)
-        return jsonify({"symbol": symbol.upper(), "country": country.upper(), "count": len(items), "items": items})
+        return jsonify({"symbol": symbol_u, "country": country_u, "count": len(items), "items": items})
 
     @app.get('/markets/instruments')
     def market_instruments():
@@ -185,7 +223,7 @@ def create_app():
 
             if not ticker:
                 return jsonify({"error": "invalid_request", "message": "'ticker' is required"}), 400
-            ticker = ticker.strip().upper()
+            ticker = _norm(ticker)
             if not ticker:
                 return jsonify({"error": "invalid_request", "message": "'ticker' must not be blank"}), 400
 
@@ -203,15 +241,37 @@ def create_app():
                 return jsonify({"error": "invalid_request", "message": "'from' must not be after 'to'"}), 400
 
             engine = get_engine()
-            from .repositories.ohlcv_repository import OhlcvRepository
-            from .serializers.ohlcv_serializer import serialize_series
             ohlcv_repo = OhlcvRepository(engine)
 
-            items = ohlcv_repo.get_range_by_ticker(ticker, from_date, to_date)
-            if items is None:
+            # Bulk consumers can opt into columnar output — either via
+            # ?format=arrow or content negotiation.  The rows then skip
+            # dict/JSON materialization entirely (see get_range_as_arrow).
+            wants_arrow = (
+                request.args.get('format') == 'arrow'
+                or _ARROW_MIMETYPE in request.accept_mimetypes
+            )
+            if wants_arrow:
+                body = ohlcv_repo.get_range_as_arrow(ticker, from_date, to_date)
+                if body is None:
+                    return jsonify({"error": "not_found", "message": f"Instrument '{ticker}' not found"}), 404
+                return app.response_class(body, mimetype=_ARROW_MIMETYPE)
+
+            # JSON default: the candle array is built by json_agg inside
+            # Postgres and spliced into the envelope as raw bytes, the
+            # same pattern as the /fundamentals range endpoint.
+            result = ohlcv_repo.get_range_by_ticker_json(ticker, from_date, to_date)
+            if result is None:
                 return jsonify({"error": "not_found", "message": f"Instrument '{ticker}' not found"}), 404
+            count, items_json = result
 
-            return jsonify(serialize_series(ticker, from_date, to_date, items))
+            envelope = orjson.dumps({
+                "ticker": ticker,
+                "from": from_date.isoformat() if from_date else None,
+                "to": to_date.isoformat() if to_date else None,
+                "count": count,
+            })
+            body = envelope[:-1] + b',"items":' + items_json.encode() + b"}"
+            return app.response_class(body, mimetype="application/json")
 
         # ---------- Latest mode: exactly one selector ----------
         provided = [p for p in (ticker, index_code, market_code) if p]
@@ -220,31 +280,36 @@ def create_app():
         if len(provided) > 1:
             return jsonify({"error": "invalid_request", "message": "Provide only one of 'ticker', 'index_code', or 'market_code'"}), 400
 
-        # Normalize
+        # Normalize once
         if ticker:
-            ticker = ticker.strip().upper()
+            ticker = _norm(ticker)
             if not ticker:
                 return jsonify({"error": "invalid_request", "message": "'ticker' must not be blank"}), 400
         if index_code:
-            index_code = index_code.strip().upper()
+            index_code = _norm(index_code)
             if not index_code:
                 return jsonify({"error": "invalid_request", "message": "'index_code' must not be blank"}), 400
         if market_code:
-            market_code = market_code.strip().upper()
+            market_code = _norm(market_code)
             if not market_code:
                 return jsonify({"error": "invalid_request", "message": "'market_code' must not be blank"}), 400
 
         # Dispatch by selector
         engine = get_engine()
-        from .repositories.ohlcv_repository import OhlcvRepository
-        from .serializers.ohlcv_serializer import serialize_candle, serialize_index_latest
         ohlcv_repo = OhlcvRepository(engine)
 
         if ticker:
             row = ohlcv_repo.get_latest_by_ticker(ticker)
             if not row:
                 return jsonify({"error": "not_found", "message": f"No OHLCV data found for ticker '{ticker}'"}), 404
-            return jsonify(serialize_candle(row))
+            # The latest candle only changes on trading days; polling
+            # clients get a 304 instead of a re-serialized body.
+            etag = f"{ticker}-{row['as_of_date']}"
+            if request.if_none_match.contains_weak(etag):
+                return '', 304
+            response = jsonify(serialize_candle(row))
+            response.set_etag(etag, weak=True)
+            return response
 
         if index_code:
             items = ohlcv_repo.get_latest_by_index(index_code)
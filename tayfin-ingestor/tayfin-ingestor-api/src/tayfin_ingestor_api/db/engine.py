@@ -7,12 +7,39 @@ Default credentials per ADR-06: tayfin_user / empty password.
 from __future__ import annotations
 
 import os
+from contextlib import nullcontext
 
-from sqlalchemy import Engine, create_engine
+from flask import g, has_request_context
+from psycopg.types.numeric import FloatLoader
+from sqlalchemy import Engine, create_engine, event
 
 _engine: Engine | None = None
 
 
+def connection_scope(engine: Engine):
+    """Context manager yielding a connection for one repository call.
+
+    Inside a Flask request every repository call shares one lazily
+    opened connection stored on ``g`` (closed by the app's teardown
+    hook), so a request that resolves an instrument and then fetches
+    data pays one pool checkout instead of one per query.  Outside a
+    request context — jobs, scripts, tests — it falls back to a fresh
+    pooled connection per call.
+    """
+    if has_request_context():
+        if "db_conn" not in g:
+            g.db_conn = engine.connect()
+        return nullcontext(g.db_conn)
+    return engine.connect()
+
+
+def close_request_connection(exc=None) -> None:
+    """Teardown hook: close the request-scoped connection, if any."""
+    conn = g.pop("db_conn", None)
+    if conn is not None:
+        conn.close()
+
+
 def get_engine() -> Engine:
     """Return a singleton SQLAlchemy engine built from environment variables."""
     global _engine
@@ -26,7 +53,30 @@ def get_engine() -> Engine:
     password = os.environ.get("POSTGRES_PASSWORD", "")
 
     url = f"postgresql+psycopg://{user}:{password}@{host}:{port}/{db}"
-    _engine = create_engine(url, future=True)
+    # Pool tuning: the singleton serves every request in the process, so
+    # keep pooled connections healthy (pre-ping + recycle) and bounded.
+    _engine = create_engine(
+        url,
+        future=True,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        # All API reads are fixed-shape statements executed repeatedly
+        # with different binds; prepare on first execution so Postgres
+        # reuses the parse/plan across calls on each pooled connection.
+        connect_args={"prepare_threshold": 0},
+    )
+
+    # This API only ever serves NUMERIC columns as JSON floats, so have
+    # psycopg decode them as float64 at the protocol level instead of
+    # building Decimal objects the repositories immediately coerce away.
+    # Unconditional: the repositories no longer coerce per value, so
+    # Decimal results would crash orjson serialization downstream.
+    @event.listens_for(_engine, "connect")
+    def _float_numerics(dbapi_conn, _record):
+        dbapi_conn.adapters.register_loader("numeric", FloatLoader)
+
     return _engine
 
 
@@ -0,0 +1,31 @@
+"""orjson-backed Flask JSON provider.
+
+Flask's default provider serializes with the pure-Python json module;
+the large list payloads from /ohlcv and /indices/members spend most of
+their handler time there.  orjson serializes the same structures 3-10x
+faster and emits bytes directly, so responses skip the intermediate str.
+"""
+
+from __future__ import annotations
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Serialize/deserialize request and response JSON with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Hand bytes straight to the response — no str round-trip.
+        return self._app.response_class(
+            orjson.dumps(obj, option=_OPTIONS), mimetype="application/json"
+        )
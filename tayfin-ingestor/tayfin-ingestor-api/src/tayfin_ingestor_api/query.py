@@ -0,0 +1,76 @@
+"""Shared query-parameter validation for the API handlers.
+
+Every list endpoint repeats the same symbol/country/limit/order parsing
+and range checks.  CommonQuery does that work exactly once per request
+into a slotted dataclass; handlers catch QueryValidationError and return
+its payload with a 400.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Static error payloads — built once at import so the validation fast
+# path only pays for jsonify.
+_ERR_SYMBOL_REQUIRED = {"error": "symbol_required", "details": "query param 'symbol' is required"}
+_ERR_LIMIT_NOT_INT = {"error": "invalid_limit", "details": "limit must be integer"}
+_ERR_INVALID_ORDER = {"error": "invalid_order", "details": "order must be 'asc' or 'desc'"}
+
+
+class QueryValidationError(ValueError):
+    """Carries the 400 response payload for an invalid query param."""
+
+    def __init__(self, payload: dict):
+        super().__init__(payload["details"])
+        self.payload = payload
+
+
+@dataclass(slots=True)
+class CommonQuery:
+    """Validated, normalized common query params (symbol/country upper)."""
+
+    symbol: str | None
+    country: str
+    limit: int | None
+    order: str
+
+    @classmethod
+    def from_request(
+        cls,
+        req,
+        *,
+        require_symbol: bool = True,
+        limit_default: int | None = None,
+        limit_max: int | None = None,
+    ) -> "CommonQuery":
+        """Parse and validate *req*'s common params in one pass.
+
+        limit parsing is skipped when *limit_default* is None (endpoints
+        that take no limit); the range check is skipped when *limit_max*
+        is None.  Raises QueryValidationError on any failure.
+        """
+        symbol = req.args.get("symbol")
+        if require_symbol and not symbol:
+            raise QueryValidationError(_ERR_SYMBOL_REQUIRED)
+
+        limit = None
+        if limit_default is not None:
+            try:
+                limit = int(req.args.get("limit", limit_default))
+            except ValueError:
+                raise QueryValidationError(_ERR_LIMIT_NOT_INT) from None
+            if limit_max is not None and not (1 <= limit <= limit_max):
+                raise QueryValidationError(
+                    {"error": "invalid_limit", "details": f"limit must be between 1 and {limit_max}"}
+                )
+
+        order = req.args.get("order", "asc").lower()
+        if order not in ("asc", "desc"):
+            raise QueryValidationError(_ERR_INVALID_ORDER)
+
+        return cls(
+            symbol=symbol.strip().upper() if symbol else None,
+            country=req.args.get("country", "US").upper(),
+            limit=limit,
+            order=order,
+        )
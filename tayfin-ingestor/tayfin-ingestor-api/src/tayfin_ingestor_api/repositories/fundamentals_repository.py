@@ -1,16 +1,113 @@
 from sqlalchemy import text
-from decimal import Decimal
 
+from ..db.engine import connection_scope
+from .instrument_repository import lookup_cached_instrument, store_cached_instrument
 
-def _dec(v):
-    if v is None:
-        return None
-    if isinstance(v, Decimal):
-        try:
-            return float(v)
-        except Exception:
-            return str(v)
-    return v
+_METRIC_COLS = (
+    "price", "eps_ttm", "bvps", "standard_bvps", "total_debt", "total_equity",
+    "net_income_ttm", "total_revenue", "pe_ratio", "pb_ratio",
+    "standard_pb_ratio", "debt_equity", "roe", "net_margin",
+    "revenue_growth_yoy", "earnings_growth_yoy",
+)
+_METRIC_COLS_SQL = ", ".join(_METRIC_COLS)
+
+# Range queries stream through a server-side cursor in 1000-row chunks
+# instead of buffering the whole result client-side before iteration,
+# so peak per-request memory is O(chunk), not O(limit).
+_STREAM_OPTS = {"stream_results": True, "yield_per": 1000}
+
+
+def _metrics(row, offset: int) -> dict:
+    """Build the metrics dict from *row* starting at column *offset*.
+
+    Values arrive from the driver as plain floats (NUMERIC decodes via
+    FloatLoader, see db.engine), so this is a single C-level zip — no
+    per-column coercion or index arithmetic, which matters on range
+    queries returning thousands of 16-metric rows.
+    """
+    return dict(zip(_METRIC_COLS, row[offset:]))
+
+
+def _range_variants(prefix: str, fr_sql: str, to_sql: str, suffix_fmt: str) -> dict:
+    """Precompute text() statements for every (fr?, to?, order) shape.
+
+    Statements are built once at import, so each request reuses the same
+    text() object and SQLAlchemy's compiled-SQL cache hits on identity
+    instead of re-parsing the literal.
+    """
+    variants = {}
+    for has_fr in (False, True):
+        for has_to in (False, True):
+            for order in ("asc", "desc"):
+                sql = prefix
+                if has_fr:
+                    sql += fr_sql
+                if has_to:
+                    sql += to_sql
+                sql += suffix_fmt.format(direction="ASC" if order == "asc" else "DESC")
+                variants[(has_fr, has_to, order)] = text(sql)
+    return variants
+
+
+_SQL_RESOLVE = text(
+    "SELECT id, ticker, country FROM tayfin_ingestor.instruments "
+    "WHERE ticker = :ticker AND country = :country LIMIT 1"
+)
+
+_SQL_LATEST = text(
+    f"SELECT as_of_date, {_METRIC_COLS_SQL} FROM tayfin_ingestor.fundamentals_snapshots "
+    "WHERE instrument_id = :instrument_id ORDER BY as_of_date DESC LIMIT 1"
+)
+
+_CTE_INSTRUMENT = (
+    "WITH i AS ("
+    "  SELECT id FROM tayfin_ingestor.instruments"
+    "  WHERE ticker = :ticker AND country = :country LIMIT 1"
+    ") "
+)
+
+_SQL_LATEST_BY_SYMBOL = text(
+    _CTE_INSTRUMENT
+    + f"SELECT s.as_of_date, {_METRIC_COLS_SQL} "
+    "FROM tayfin_ingestor.fundamentals_snapshots s "
+    "JOIN i ON s.instrument_id = i.id "
+    "ORDER BY s.as_of_date DESC LIMIT 1"
+)
+
+_RANGE_STMTS = _range_variants(
+    f"SELECT as_of_date, {_METRIC_COLS_SQL} FROM tayfin_ingestor.fundamentals_snapshots "
+    "WHERE instrument_id = :instrument_id",
+    " AND as_of_date >= :fr",
+    " AND as_of_date <= :to",
+    " ORDER BY as_of_date {direction} LIMIT :limit",
+)
+
+_RANGE_BY_SYMBOL_STMTS = _range_variants(
+    _CTE_INSTRUMENT
+    + f"SELECT s.as_of_date, {_METRIC_COLS_SQL} "
+    "FROM tayfin_ingestor.fundamentals_snapshots s "
+    "JOIN i ON s.instrument_id = i.id WHERE TRUE",
+    " AND s.as_of_date >= :fr",
+    " AND s.as_of_date <= :to",
+    " ORDER BY s.as_of_date {direction} LIMIT :limit",
+)
+
+_RANGE_JSON_STMTS = _range_variants(
+    _CTE_INSTRUMENT.rstrip()
+    + ", r AS ("
+    f"  SELECT s.as_of_date, {_METRIC_COLS_SQL} "
+    "  FROM tayfin_ingestor.fundamentals_snapshots s "
+    "  JOIN i ON s.instrument_id = i.id WHERE TRUE",
+    " AND s.as_of_date >= :fr",
+    " AND s.as_of_date <= :to",
+    " ORDER BY s.as_of_date {direction} LIMIT :limit"
+    ") "
+    "SELECT count(*)::int, "
+    # ::text so the driver hands back the raw JSON string instead
+    # of parsing it into Python objects we would only re-serialize.
+    "COALESCE(json_agg(row_to_json(r) ORDER BY r.as_of_date {direction})::text, '[]') "
+    "FROM r",
+)
 
 
 class FundamentalsRepository:
@@ -18,82 +115,95 @@ class FundamentalsRepository:
         self.engine = engine
 
     def resolve_instrument(self, ticker: str, country: str):
-        stmt = text("SELECT id, ticker, country FROM tayfin_ingestor.instruments WHERE ticker = :ticker AND country = :country LIMIT 1")
+        # Shared process-local TTL cache (see instrument_repository) —
+        # resolves are the one query every endpoint repeats.
+        cached = lookup_cached_instrument(ticker, country)
+        if cached is not None:
+            return cached
         params = {"ticker": ticker, "country": country}
-        with self.engine.connect() as conn:
-            res = conn.execute(stmt, params)
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(_SQL_RESOLVE, params)
             row = res.fetchone()
             if not row:
                 return None
-            return {"id": str(row[0]), "ticker": row[1], "country": row[2]}
+            # id stays a uuid.UUID — see InstrumentRepository.resolve.
+            instrument = {"id": row[0], "ticker": row[1], "country": row[2]}
+            store_cached_instrument(ticker, country, instrument)
+            return instrument
 
     def get_latest_snapshot(self, instrument_id: str):
-        stmt = text(
-            "SELECT as_of_date, price, eps_ttm, bvps, standard_bvps, total_debt, total_equity, net_income_ttm, total_revenue, pe_ratio, pb_ratio, standard_pb_ratio, debt_equity, roe, net_margin, revenue_growth_yoy, earnings_growth_yoy FROM tayfin_ingestor.fundamentals_snapshots WHERE instrument_id = :instrument_id ORDER BY as_of_date DESC LIMIT 1"
-        )
         params = {"instrument_id": instrument_id}
-        with self.engine.connect() as conn:
-            res = conn.execute(stmt, params)
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(_SQL_LATEST, params)
             row = res.fetchone()
             if not row:
                 return None
-            as_of = row[0]
-            metrics = {
-                "price": _dec(row[1]),
-                "eps_ttm": _dec(row[2]),
-                "bvps": _dec(row[3]),
-                "standard_bvps": _dec(row[4]),
-                "total_debt": _dec(row[5]),
-                "total_equity": _dec(row[6]),
-                "net_income_ttm": _dec(row[7]),
-                "total_revenue": _dec(row[8]),
-                "pe_ratio": _dec(row[9]),
-                "pb_ratio": _dec(row[10]),
-                "standard_pb_ratio": _dec(row[11]),
-                "debt_equity": _dec(row[12]),
-                "roe": _dec(row[13]),
-                "net_margin": _dec(row[14]),
-                "revenue_growth_yoy": _dec(row[15]),
-                "earnings_growth_yoy": _dec(row[16]),
-            }
-            return {"as_of_date": as_of, "metrics": metrics}
+            return {"as_of_date": row[0], "metrics": _metrics(row, 1)}
+
+    def get_latest_snapshot_by_symbol(self, ticker: str, country: str):
+        """Latest snapshot for (ticker, country) in one round-trip.
+
+        Fuses instrument resolution and the snapshot fetch via a CTE, so
+        the hot path costs a single query.  Returns None when either the
+        instrument or the snapshot is missing — callers that need to
+        distinguish the two can resolve_instrument on the miss path.
+        """
+        params = {"ticker": ticker, "country": country}
+        with connection_scope(self.engine) as conn:
+            row = conn.execute(_SQL_LATEST_BY_SYMBOL, params).fetchone()
+            if not row:
+                return None
+            return {"as_of_date": row[0], "metrics": _metrics(row, 1)}
 
     def get_snapshots_range(self, instrument_id: str, fr, to, limit: int, order: str):
-        sql = "SELECT as_of_date, price, eps_ttm, bvps, standard_bvps, total_debt, total_equity, net_income_ttm, total_revenue, pe_ratio, pb_ratio, standard_pb_ratio, debt_equity, roe, net_margin, revenue_growth_yoy, earnings_growth_yoy FROM tayfin_ingestor.fundamentals_snapshots WHERE instrument_id = :instrument_id"
+        stmt = _RANGE_STMTS[(bool(fr), bool(to), order)]
+        params = {"instrument_id": instrument_id, "limit": limit}
         if fr:
-            sql += " AND as_of_date >= :fr"
+            params["fr"] = fr
         if to:
-            sql += " AND as_of_date <= :to"
-        sql += f" ORDER BY as_of_date { 'ASC' if order=='asc' else 'DESC' } LIMIT :limit"
+            params["to"] = to
 
-        stmt = text(sql)
-        params = {"instrument_id": instrument_id, "limit": limit}
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(stmt, params, execution_options=_STREAM_OPTS)
+            return [
+                {"as_of_date": r[0].isoformat(), **_metrics(r, 1)} for r in res
+            ]
+
+    def get_snapshots_range_by_symbol(self, ticker: str, country: str, fr, to, limit: int, order: str):
+        """Range of snapshots for (ticker, country) in one round-trip.
+
+        Same CTE fusion as get_latest_snapshot_by_symbol; an empty list
+        can mean either an unknown instrument or no snapshots in range.
+        """
+        stmt = _RANGE_BY_SYMBOL_STMTS[(bool(fr), bool(to), order)]
+        params = {"ticker": ticker, "country": country, "limit": limit}
+        if fr:
+            params["fr"] = fr
+        if to:
+            params["to"] = to
+
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(stmt, params, execution_options=_STREAM_OPTS)
+            return [
+                {"as_of_date": r[0].isoformat(), **_metrics(r, 1)} for r in res
+            ]
+
+    def get_snapshots_range_json(self, ticker: str, country: str, fr, to, limit: int, order: str):
+        """Range of snapshots aggregated to JSON inside Postgres.
+
+        Returns ``(count, json_text)`` where json_text is a JSON array
+        string built by json_agg/row_to_json — the rows never exist as
+        Python dicts, so the handler can splice the bytes straight into
+        its response envelope.  count is 0 for unknown instruments too;
+        callers disambiguate via resolve_instrument on the miss path.
+        """
+        stmt = _RANGE_JSON_STMTS[(bool(fr), bool(to), order)]
+        params = {"ticker": ticker, "country": country, "limit": limit}
         if fr:
             params["fr"] = fr
         if to:
             params["to"] = to
 
-        items = []
-        with self.engine.connect() as conn:
-            res = conn.execute(stmt, params)
-            for row in res:
-                items.append({
-                    "as_of_date": row[0].isoformat(),
-                    "price": _dec(row[1]),
-                    "eps_ttm": _dec(row[2]),
-                    "bvps": _dec(row[3]),
-                    "standard_bvps": _dec(row[4]),
-                    "total_debt": _dec(row[5]),
-                    "total_equity": _dec(row[6]),
-                    "net_income_ttm": _dec(row[7]),
-                    "total_revenue": _dec(row[8]),
-                    "pe_ratio": _dec(row[9]),
-                    "pb_ratio": _dec(row[10]),
-                    "standard_pb_ratio": _dec(row[11]),
-                    "debt_equity": _dec(row[12]),
-                    "roe": _dec(row[13]),
-                    "net_margin": _dec(row[14]),
-                    "revenue_growth_yoy": _dec(row[15]),
-                    "earnings_growth_yoy": _dec(row[16]),
-                })
-        return items
+        with connection_scope(self.engine) as conn:
+            row = conn.execute(stmt, params).fetchone()
+        return row[0], row[1]
@@ -1,34 +1,89 @@
 from sqlalchemy import text
 
+from ..db.engine import connection_scope
+
+
+def _members_variants() -> dict:
+    """Precompute text() statements for every (country?, order) shape.
+
+    Built once at import so each call reuses the same text() object and
+    SQLAlchemy's compiled-SQL cache hits on identity instead of
+    re-parsing a freshly concatenated literal.
+    """
+    variants = {}
+    for has_country in (False, True):
+        for order in ("asc", "desc"):
+            sql = (
+                "SELECT im.instrument_id, i.ticker, i.country "
+                "FROM tayfin_ingestor.index_memberships im "
+                "JOIN tayfin_ingestor.instruments i ON im.instrument_id = i.id "
+                "WHERE im.index_code = :index_code"
+            )
+            if has_country:
+                sql += " AND i.country = :country"
+            sql += f" ORDER BY i.ticker {'ASC' if order == 'asc' else 'DESC'} LIMIT :limit"
+            variants[(has_country, order)] = text(sql)
+    return variants
+
+
+_MEMBERS_STMTS = _members_variants()
+
+_SQL_INDICES_FOR_INSTRUMENT = text(
+    "SELECT index_code FROM tayfin_ingestor.index_memberships "
+    "WHERE instrument_id = :instrument_id ORDER BY index_code LIMIT :limit"
+)
+
+_SQL_INDICES_BY_SYMBOL = text(
+    "WITH i AS ("
+    "  SELECT id FROM tayfin_ingestor.instruments"
+    "  WHERE ticker = :ticker AND country = :country LIMIT 1"
+    ") "
+    "SELECT im.index_code FROM tayfin_ingestor.index_memberships im "
+    "JOIN i ON im.instrument_id = i.id "
+    "ORDER BY im.index_code LIMIT :limit"
+)
+
 
 class IndexMembershipRepository:
     def __init__(self, engine):
         self.engine = engine
 
     def get_members(self, index_code: str, country: str | None, limit: int, order: str):
-        sql = "SELECT im.instrument_id, i.ticker, i.country FROM tayfin_ingestor.index_memberships im JOIN tayfin_ingestor.instruments i ON im.instrument_id = i.id WHERE im.index_code = :index_code"
-        params = {"index_code": index_code}
+        stmt = _MEMBERS_STMTS[(bool(country), order)]
+        params = {"index_code": index_code, "limit": limit}
         if country:
-            sql += " AND i.country = :country"
             params["country"] = country
-        sql += f" ORDER BY i.ticker {'ASC' if order=='asc' else 'DESC'} LIMIT :limit"
-        params["limit"] = limit
 
         items = []
-        stmt = text(sql)
-        with self.engine.connect() as conn:
+        with connection_scope(self.engine) as conn:
             res = conn.execute(stmt, params)
             for row in res:
-                items.append({"instrument_id": str(row[0]), "symbol": row[1], "country": row[2]})
+                # UUID passes through — orjson renders it as the
+                # canonical string without the per-row str() allocation.
+                items.append({"instrument_id": row[0], "symbol": row[1], "country": row[2]})
+        return items
+
+    def get_indices_by_symbol(self, ticker: str, country: str, limit: int):
+        """Index memberships for (ticker, country) in one round-trip.
+
+        Fuses instrument resolution and the membership fetch via a CTE,
+        the same pattern as the fundamentals by-symbol queries.  An
+        empty list can mean either an unknown instrument or no
+        memberships; callers disambiguate on the miss path.
+        """
+        params = {"ticker": ticker, "country": country, "limit": limit}
+        items = []
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(_SQL_INDICES_BY_SYMBOL, params)
+            for row in res:
+                items.append({"index_code": row[0]})
         return items
 
     def get_indices_for_instrument(self, instrument_id: str, limit: int):
-        sql = "SELECT index_code FROM tayfin_ingestor.index_memberships WHERE instrument_id = :instrument_id LIMIT :limit"
         params = {"instrument_id": instrument_id, "limit": limit}
         items = []
-        stmt = text(sql)
-        with self.engine.connect() as conn:
-            res = conn.execute(stmt, params)
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(_SQL_INDICES_FOR_INSTRUMENT, params)
             for row in res:
                 items.append({"index_code": row[0]})
         return items
@@ -1,16 +1,54 @@
+from threading import Lock
+
+from cachetools import TTLCache
 from sqlalchemy import text
 
+from ..db.engine import connection_scope
+
+# (ticker, country) -> instrument dict, shared by every repository that
+# resolves instruments.  The mapping is effectively static, so a
+# process-local TTL cache turns the resolve round-trip into a dict
+# lookup for a warmed process.  Module scope so it survives the
+# per-request repository instantiations; only hits are cached, so newly
+# ingested instruments become visible immediately.
+_INSTRUMENT_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=3600)
+_INSTRUMENT_CACHE_LOCK = Lock()
+
+_SQL_RESOLVE = text(
+    "SELECT id, ticker, country FROM tayfin_ingestor.instruments "
+    "WHERE ticker = :ticker AND country = :country LIMIT 1"
+)
+
+
+def lookup_cached_instrument(ticker: str, country: str):
+    """Return the cached instrument dict for (ticker, country), or None."""
+    with _INSTRUMENT_CACHE_LOCK:
+        return _INSTRUMENT_CACHE.get((ticker, country))
+
+
+def store_cached_instrument(ticker: str, country: str, instrument: dict) -> None:
+    """Cache a successfully resolved instrument."""
+    with _INSTRUMENT_CACHE_LOCK:
+        _INSTRUMENT_CACHE[(ticker, country)] = instrument
+
 
 class InstrumentRepository:
     def __init__(self, engine):
         self.engine = engine
 
     def resolve(self, ticker: str, country: str):
-        stmt = text("SELECT id, ticker, country FROM tayfin_ingestor.instruments WHERE ticker = :ticker AND country = :country LIMIT 1")
+        cached = lookup_cached_instrument(ticker, country)
+        if cached is not None:
+            return cached
         params = {"ticker": ticker, "country": country}
-        with self.engine.connect() as conn:
-            res = conn.execute(stmt, params)
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(_SQL_RESOLVE, params)
             row = res.fetchone()
             if not row:
                 return None
-            return {"id": str(row[0]), "ticker": row[1], "country": row[2]}
+            # id stays a uuid.UUID — psycopg binds it natively and orjson
+            # renders it as the canonical string, so stringifying here
+            # would only add an allocation per resolve.
+            instrument = {"id": row[0], "ticker": row[1], "country": row[2]}
+            store_cached_instrument(ticker, country, instrument)
+            return instrument
@@ -2,21 +2,123 @@
 from __future__ import annotations
 
 from datetime import date
-from decimal import Decimal
 
+import pyarrow as pa
+import pyarrow.ipc
 from sqlalchemy import text
 
+from ..db.engine import connection_scope
 
-def _dec(v):
-    """Convert Decimal to float for JSON serialisation."""
-    if v is None:
-        return None
-    if isinstance(v, Decimal):
-        try:
-            return float(v)
-        except Exception:
-            return str(v)
-    return v
+# Statements are module-level constants so each request reuses the same
+# text() object and SQLAlchemy's compiled cache hits on identity.
+_SQL_RESOLVE_ID = text(
+    "SELECT id FROM tayfin_ingestor.instruments "
+    "WHERE ticker = :ticker AND country = :country "
+    "LIMIT 1"
+)
+
+_OHLCV_COLS_SQL = "i.ticker, o.as_of_date, o.open, o.high, o.low, o.close, o.volume"
+
+# Resolution is fused into the data queries: the JOIN filters on
+# (ticker, country) directly, so the hot path is one round-trip.
+_SQL_LATEST_BY_TICKER = text(
+    f"SELECT {_OHLCV_COLS_SQL} "
+    "FROM tayfin_ingestor.ohlcv_daily o "
+    "JOIN tayfin_ingestor.instruments i ON o.instrument_id = i.id "
+    "WHERE i.ticker = :ticker AND i.country = :country "
+    "ORDER BY o.as_of_date DESC "
+    "LIMIT 1"
+)
+
+_SQL_LATEST_BY_TICKERS = text(
+    "SELECT i.ticker, m.as_of_date, m.open, m.high, m.low, m.close, m.volume "
+    "FROM tayfin_ingestor.mv_ohlcv_latest m "
+    "JOIN tayfin_ingestor.instruments i ON m.instrument_id = i.id "
+    # psycopg adapts the bound Python list to text[], so one prepared
+    # plan serves any batch size.
+    "WHERE i.ticker = ANY(:tickers) AND i.country = :country"
+)
+
+# Latest-per-instrument comes from the materialized view (see
+# db migration V6), so this is a straight join on index members
+# instead of a DISTINCT ON scan over the whole candle history.  The
+# view is refreshed by the OHLCV ingestion job after each load.
+_SQL_LATEST_BY_INDEX = text(
+    "SELECT i.ticker, m.as_of_date, m.open, m.high, m.low, m.close, m.volume "
+    "FROM tayfin_ingestor.index_memberships im "
+    "JOIN tayfin_ingestor.mv_ohlcv_latest m ON m.instrument_id = im.instrument_id "
+    "JOIN tayfin_ingestor.instruments i ON i.id = im.instrument_id "
+    "WHERE im.index_code = :index_code "
+    "ORDER BY i.ticker ASC"
+)
+
+
+def _build_range_stmts() -> dict:
+    """Precompute the four (from?, to?) variants of the range query."""
+    variants = {}
+    for has_fr in (False, True):
+        for has_to in (False, True):
+            sql = (
+                f"SELECT {_OHLCV_COLS_SQL} "
+                "FROM tayfin_ingestor.ohlcv_daily o "
+                "JOIN tayfin_ingestor.instruments i ON o.instrument_id = i.id "
+                "WHERE i.ticker = :ticker AND i.country = :country"
+            )
+            if has_fr:
+                sql += " AND o.as_of_date >= :from_date"
+            if has_to:
+                sql += " AND o.as_of_date <= :to_date"
+            sql += " ORDER BY o.as_of_date ASC"
+            variants[(has_fr, has_to)] = text(sql)
+    return variants
+
+
+_RANGE_STMTS = _build_range_stmts()
+
+
+def _build_range_json_stmts() -> dict:
+    """(from?, to?) variants aggregating the range to JSON in Postgres."""
+    variants = {}
+    for has_fr in (False, True):
+        for has_to in (False, True):
+            sql = (
+                "WITH c AS ("
+                "  SELECT i.ticker, o.as_of_date, o.open::float8 AS open,"
+                "         o.high::float8 AS high, o.low::float8 AS low,"
+                "         o.close::float8 AS close, o.volume "
+                "  FROM tayfin_ingestor.ohlcv_daily o "
+                "  JOIN tayfin_ingestor.instruments i ON o.instrument_id = i.id "
+                "  WHERE i.ticker = :ticker AND i.country = :country"
+            )
+            if has_fr:
+                sql += " AND o.as_of_date >= :from_date"
+            if has_to:
+                sql += " AND o.as_of_date <= :to_date"
+            sql += (
+                ") "
+                "SELECT count(*)::int, "
+                # ::text so the driver hands back the raw JSON string
+                # instead of parsing it into objects we would only
+                # re-serialize.
+                "COALESCE(json_agg(row_to_json(c) ORDER BY c.as_of_date)::text, '[]') "
+                "FROM c"
+            )
+            variants[(has_fr, has_to)] = text(sql)
+    return variants
+
+
+_RANGE_JSON_STMTS = _build_range_json_stmts()
+
+# Columnar schema for Arrow IPC range exports; mirrors _OHLCV_COLS_SQL.
+_ARROW_SCHEMA = pa.schema([
+    ("ticker", pa.string()),
+    ("as_of_date", pa.date32()),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+])
 
 
 def _row_to_dict(row) -> dict:
@@ -24,14 +126,18 @@ def _row_to_dict(row) -> dict:
 
     API responses intentionally omit per-provider `source` metadata; callers
     should treat returned OHLCV as the canonical snapshot for that date.
+    Prices arrive as plain floats — NUMERIC decodes via FloatLoader at
+    the driver (see db.engine), so no per-value coercion is needed here.
+    Likewise as_of_date is always a datetime.date from psycopg, so the
+    isoformat call is unconditional.
     """
     return {
         "ticker": row[0],
-        "as_of_date": row[1].isoformat() if hasattr(row[1], "isoformat") else str(row[1]),
-        "open": _dec(row[2]),
-        "high": _dec(row[3]),
-        "low": _dec(row[4]),
-        "close": _dec(row[5]),
+        "as_of_date": row[1].isoformat(),
+        "open": row[2],
+        "high": row[3],
+        "low": row[4],
+        "close": row[5],
         "volume": row[6],
     }
 
@@ -44,39 +150,45 @@ class OhlcvRepository:
     # Instrument resolution (duplicated to keep API context self-contained)
     # ------------------------------------------------------------------
 
-    def _resolve_instrument_id(self, ticker: str, country: str = "US") -> str | None:
-        stmt = text(
-            "SELECT id FROM tayfin_ingestor.instruments "
-            "WHERE ticker = :ticker AND country = :country "
-            "LIMIT 1"
-        )
-        with self.engine.connect() as conn:
-            row = conn.execute(stmt, {"ticker": ticker, "country": country}).fetchone()
-            return str(row[0]) if row else None
+    def _resolve_instrument_id(self, ticker: str, country: str = "US"):
+        """Existence check — only hit on the rare empty-result path.
+
+        Returns the uuid.UUID as-is (psycopg binds it natively); callers
+        only test it for None.
+        """
+        with connection_scope(self.engine) as conn:
+            row = conn.execute(_SQL_RESOLVE_ID, {"ticker": ticker, "country": country}).fetchone()
+            return row[0] if row else None
 
     # ------------------------------------------------------------------
     # 1) Latest candle for a single ticker
     # ------------------------------------------------------------------
 
     def get_latest_by_ticker(self, ticker: str, country: str = "US") -> dict | None:
-        instrument_id = self._resolve_instrument_id(ticker, country)
-        if not instrument_id:
-            return None
-
-        stmt = text(
-            "SELECT i.ticker, o.as_of_date, o.open, o.high, o.low, o.close, o.volume "
-            "FROM tayfin_ingestor.ohlcv_daily o "
-            "JOIN tayfin_ingestor.instruments i ON o.instrument_id = i.id "
-            "WHERE o.instrument_id = :instrument_id "
-            "ORDER BY o.as_of_date DESC "
-            "LIMIT 1"
-        )
-        with self.engine.connect() as conn:
-            row = conn.execute(stmt, {"instrument_id": instrument_id}).fetchone()
+        """Return the latest candle, or None (unknown ticker or no data)."""
+        with connection_scope(self.engine) as conn:
+            row = conn.execute(
+                _SQL_LATEST_BY_TICKER, {"ticker": ticker, "country": country}
+            ).fetchone()
             if not row:
                 return None
             return _row_to_dict(row)
 
+    def get_latest_by_tickers(self, tickers: list[str], country: str = "US") -> dict[str, dict]:
+        """Latest candle for each of *tickers* in a single query.
+
+        Bulk twin of get_latest_by_ticker: one ``= ANY(:tickers)`` +
+        ``DISTINCT ON`` round-trip instead of N requests.  Returns a
+        mapping keyed by ticker; tickers with no data are simply absent.
+        """
+        if not tickers:
+            return {}
+        with connection_scope(self.engine) as conn:
+            res = conn.execute(
+                _SQL_LATEST_BY_TICKERS, {"tickers": list(tickers), "country": country}
+            )
+            return {row[0]: _row_to_dict(row) for row in res}
+
     # ------------------------------------------------------------------
     # 2) Time-range for a single ticker
     # ------------------------------------------------------------------
@@ -89,32 +201,94 @@ class OhlcvRepository:
         country: str = "US",
     ) -> list[dict] | None:
         """Return candles in ascending date order, or None if instrument not found."""
-        instrument_id = self._resolve_instrument_id(ticker, country)
-        if not instrument_id:
-            return None  # instrument not found
-
-        sql = (
-            "SELECT i.ticker, o.as_of_date, o.open, o.high, o.low, o.close, o.volume "
-            "FROM tayfin_ingestor.ohlcv_daily o "
-            "JOIN tayfin_ingestor.instruments i ON o.instrument_id = i.id "
-            "WHERE o.instrument_id = :instrument_id"
-        )
-        params: dict = {"instrument_id": instrument_id}
+        stmt = _RANGE_STMTS[(bool(from_date), bool(to_date))]
+        params: dict = {"ticker": ticker, "country": country}
+        if from_date:
+            params["from_date"] = from_date
+        if to_date:
+            params["to_date"] = to_date
 
+        with connection_scope(self.engine) as conn:
+            # Stream in chunks via a server-side cursor — peak memory is
+            # O(chunk) during iteration rather than a second full copy.
+            res = conn.execute(
+                stmt, params, execution_options={"stream_results": True, "yield_per": 1000}
+            )
+            items: list[dict] = [_row_to_dict(r) for r in res]
+        if items:
+            return items
+        # Zero rows is ambiguous — distinguish "unknown instrument"
+        # (None) from "no candles in range" ([]) on this rare path only.
+        if self._resolve_instrument_id(ticker, country) is None:
+            return None
+        return items
+
+    def get_range_by_ticker_json(
+        self,
+        ticker: str,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        country: str = "US",
+    ):
+        """Range aggregated to a JSON array string inside Postgres.
+
+        Returns ``(count, json_text)``, or None if the instrument is
+        unknown.  The candles never exist as Python dicts — the handler
+        splices json_text straight into its response envelope, the same
+        pattern the fundamentals range endpoint uses.
+        """
+        stmt = _RANGE_JSON_STMTS[(bool(from_date), bool(to_date))]
+        params: dict = {"ticker": ticker, "country": country}
         if from_date:
-            sql += " AND o.as_of_date >= :from_date"
             params["from_date"] = from_date
         if to_date:
-            sql += " AND o.as_of_date <= :to_date"
             params["to_date"] = to_date
 
-        sql += " ORDER BY o.as_of_date ASC"
+        with connection_scope(self.engine) as conn:
+            row = conn.execute(stmt, params).fetchone()
+        if row[0] == 0 and self._resolve_instrument_id(ticker, country) is None:
+            return None
+        return row[0], row[1]
 
-        items: list[dict] = []
-        with self.engine.connect() as conn:
-            for row in conn.execute(text(sql), params):
-                items.append(_row_to_dict(row))
-        return items
+    def get_range_as_arrow(
+        self,
+        ticker: str,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        country: str = "US",
+    ) -> bytes | None:
+        """Return the range as Arrow IPC stream bytes, or None if not found.
+
+        Columnar twin of get_range_by_ticker for bulk consumers: rows are
+        transposed once into Arrow arrays and serialized with the IPC
+        stream format, so per-cell float→str JSON encoding disappears and
+        clients decode with a buffer read instead of a parse.  Zero rows
+        for a known instrument yields an empty (schema-only) stream.
+        """
+        stmt = _RANGE_STMTS[(bool(from_date), bool(to_date))]
+        params: dict = {"ticker": ticker, "country": country}
+        if from_date:
+            params["from_date"] = from_date
+        if to_date:
+            params["to_date"] = to_date
+
+        with connection_scope(self.engine) as conn:
+            rows = conn.execute(stmt, params).fetchall()
+
+        if not rows:
+            if self._resolve_instrument_id(ticker, country) is None:
+                return None
+            columns = [[] for _ in _ARROW_SCHEMA]
+        else:
+            columns = list(zip(*rows))
+        batch = pa.record_batch(
+            [pa.array(col, type=field.type) for col, field in zip(columns, _ARROW_SCHEMA)],
+            schema=_ARROW_SCHEMA,
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, _ARROW_SCHEMA) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
 
     # ------------------------------------------------------------------
     # 3) Latest candle per member of an index
@@ -125,17 +299,8 @@ class OhlcvRepository:
 
         Uses Postgres ``DISTINCT ON`` for an efficient single-pass query.
         """
-        stmt = text(
-            "SELECT DISTINCT ON (o.instrument_id) "
-            "  i.ticker, o.as_of_date, o.open, o.high, o.low, o.close, o.volume "
-            "FROM tayfin_ingestor.index_memberships im "
-            "JOIN tayfin_ingestor.ohlcv_daily o ON o.instrument_id = im.instrument_id "
-            "JOIN tayfin_ingestor.instruments i ON i.id = im.instrument_id "
-            "WHERE im.index_code = :index_code "
-            "ORDER BY o.instrument_id, o.as_of_date DESC"
-        )
         items: list[dict] = []
-        with self.engine.connect() as conn:
-            for row in conn.execute(stmt, {"index_code": index_code}):
+        with connection_scope(self.engine) as conn:
+            for row in conn.execute(_SQL_LATEST_BY_INDEX, {"index_code": index_code}):
                 items.append(_row_to_dict(row))
         return items
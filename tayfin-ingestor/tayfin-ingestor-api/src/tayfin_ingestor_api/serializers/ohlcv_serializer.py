@@ -15,16 +15,23 @@ from typing import Any
 # Internal helpers
 # ------------------------------------------------------------------
 
+# Exact-type dispatch tables: one dict lookup per value on the hot
+# path instead of an isinstance chain — serialize_candle runs per cell
+# across thousands-of-row range payloads.  Unknown types fall through
+# to KeyError, which the wrappers turn into the same ValueError the
+# isinstance chain used to raise.
+_FLOAT_DISPATCH = {Decimal: float, int: float, float: float}
+_INT_DISPATCH = {Decimal: int, int: int, float: int}
+
+
 def _to_float(v: Any) -> float:
     """Coerce a numeric value to float.  Raises ValueError on NaN/None."""
-    if v is None:
-        raise ValueError("unexpected None in numeric OHLCV field")
-    if isinstance(v, Decimal):
-        f = float(v)
-    elif isinstance(v, (int, float)):
-        f = float(v)
-    else:
-        raise ValueError(f"unexpected type {type(v).__name__} in numeric OHLCV field")
+    try:
+        f = _FLOAT_DISPATCH[type(v)](v)
+    except KeyError:
+        raise ValueError(
+            f"unexpected type {type(v).__name__} in numeric OHLCV field"
+        ) from None
     if math.isnan(f) or math.isinf(f):
         raise ValueError(f"unexpected {f} in numeric OHLCV field")
     return f
@@ -32,22 +39,23 @@ def _to_float(v: Any) -> float:
 
 def _to_int(v: Any) -> int:
     """Coerce volume to int.  Accepts int, float, or Decimal."""
-    if v is None:
-        raise ValueError("unexpected None for volume")
-    if isinstance(v, Decimal):
-        return int(v)
-    if isinstance(v, float):
-        if math.isnan(v) or math.isinf(v):
+    try:
+        if type(v) is float and (math.isnan(v) or math.isinf(v)):
             raise ValueError(f"unexpected {v} for volume")
-        return int(v)
-    return int(v)
+        return _INT_DISPATCH[type(v)](v)
+    except KeyError:
+        raise ValueError(f"unexpected type {type(v).__name__} for volume") from None
 
 
 def _date_str(d: Any) -> str:
     """as_of_date → 'YYYY-MM-DD' string."""
-    if isinstance(d, date):
-        return d.isoformat()
-    return str(d)
+    iso = getattr(d, "isoformat", None)
+    return iso() if iso is not None else str(d)
+
+
+_CANDLE_KEYS = frozenset(
+    ("ticker", "as_of_date", "open", "high", "low", "close", "volume")
+)
 
 
 # ------------------------------------------------------------------
@@ -76,20 +84,34 @@ def serialize_series(
     to_date: date | None,
     items: list[dict],
 ) -> dict:
-    """Wrap a list of candles into a range-query response envelope."""
+    """Wrap a list of candles into a range-query response envelope.
+
+    *items* come from OhlcvRepository._row_to_dict and are already
+    JSON-safe (float prices via the driver's FloatLoader, int volume,
+    ISO date string), so they pass through untouched — re-running
+    serialize_candle per row would be a second full coercion pass over
+    the largest payloads the API serves.  The assert documents and, in
+    tests, enforces that contract; it compiles away under -O.
+    """
+    assert not items or set(items[0]) == _CANDLE_KEYS, (
+        f"range items do not conform to candle shape: {set(items[0])}"
+    )
     return {
         "ticker": ticker,
         "from": from_date.isoformat() if from_date else None,
         "to": to_date.isoformat() if to_date else None,
         "count": len(items),
-        "items": [serialize_candle(it) for it in items],
+        "items": items,
     }
 
 
 def serialize_index_latest(index_code: str, items: list[dict]) -> dict:
-    """Wrap per-ticker latest candles into an index-latest response envelope."""
+    """Wrap per-ticker latest candles into an index-latest response envelope.
+
+    *items* are expected already sorted by ticker — the repository query
+    orders at the SQL level, so no Python-side re-sort happens here.
+    """
     serialized = [serialize_candle(it) for it in items]
-    serialized.sort(key=lambda c: c["ticker"])
     return {
         "index_code": index_code,
         "count": len(serialized),
@@ -56,6 +56,12 @@ def _ohlcv_values(
     }
 
 
+def _refresh_latest_view(engine) -> None:
+    """Refresh mv_ohlcv_latest so seeded/cleaned rows are visible to reads."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW tayfin_ingestor.mv_ohlcv_latest"))
+
+
 # ------------------------------------------------------------------
 # Fixtures
 # ------------------------------------------------------------------
@@ -107,19 +113,23 @@ def seed(db_engine):
         aapl_id = _ensure_instrument(conn, "AAPL", "US")
         msft_id = _ensure_instrument(conn, "MSFT", "US")
 
-        # 3) Index memberships for TEST_NDX
-        for instr_id in (aapl_id, msft_id):
-            conn.execute(
-                text(
-                    "INSERT INTO tayfin_ingestor.index_memberships "
-                    "(index_code, instrument_id, country, created_by_job_run_id) "
-                    "VALUES (:ic, :iid, 'US', :jr) "
-                    "ON CONFLICT (index_code, instrument_id) DO NOTHING"
-                ),
-                {"ic": TEST_INDEX_CODE, "iid": str(instr_id), "jr": str(job_run_id)},
-            )
+        # 3) Index memberships for TEST_NDX — one executemany round-trip
+        conn.execute(
+            text(
+                "INSERT INTO tayfin_ingestor.index_memberships "
+                "(index_code, instrument_id, country, created_by_job_run_id) "
+                "VALUES (:ic, :iid, 'US', :jr) "
+                "ON CONFLICT (index_code, instrument_id) DO NOTHING"
+            ),
+            [
+                {"ic": TEST_INDEX_CODE, "iid": str(instr_id), "jr": str(job_run_id)}
+                for instr_id in (aapl_id, msft_id)
+            ],
+        )
 
-        # 4) OHLCV rows — AAPL × 3 dates, MSFT × 2 dates
+        # 4) OHLCV rows — AAPL × 3 dates, MSFT × 2 dates, batched into a
+        # single executemany so the seed pays one round-trip, not one
+        # per row (the same pattern bulk ingestion code should use).
         insert_ohlcv = text(
             "INSERT INTO tayfin_ingestor.ohlcv_daily "
             "(instrument_id, as_of_date, open, high, low, close, volume, source, created_by_job_run_id) "
@@ -127,16 +137,18 @@ def seed(db_engine):
             "ON CONFLICT (instrument_id, as_of_date) DO NOTHING"
         )
 
-        for i, d in enumerate(AAPL_DATES):
-            conn.execute(
-                insert_ohlcv,
-                _ohlcv_values(aapl_id, d, job_run_id, open_=100 + i, close=102 + i, volume=10000 + i * 100),
-            )
-        for i, d in enumerate(MSFT_DATES):
-            conn.execute(
-                insert_ohlcv,
-                _ohlcv_values(msft_id, d, job_run_id, open_=200 + i, close=202 + i, volume=20000 + i * 100),
-            )
+        rows = [
+            _ohlcv_values(aapl_id, d, job_run_id, open_=100 + i, close=102 + i, volume=10000 + i * 100)
+            for i, d in enumerate(AAPL_DATES)
+        ] + [
+            _ohlcv_values(msft_id, d, job_run_id, open_=200 + i, close=202 + i, volume=20000 + i * 100)
+            for i, d in enumerate(MSFT_DATES)
+        ]
+        conn.execute(insert_ohlcv, rows)
+
+    # Latest-per-instrument reads go through mv_ohlcv_latest (V6); make
+    # the seeded rows visible the same way the ingestion job would.
+    _refresh_latest_view(engine)
 
     yield {
         "job_run_id": job_run_id,
@@ -167,6 +179,7 @@ def seed(db_engine):
             text("DELETE FROM tayfin_ingestor.job_runs WHERE id = :jr"),
             {"jr": str(job_run_id)},
         )
+    _refresh_latest_view(engine)
 
 
 @pytest.fixture(scope="module")
@@ -21,6 +21,19 @@ class DummyRepo:
     def get_snapshots_range(self, instrument_id: str, fr, to, limit: int, order: str):
         return self._snapshots
 
+    # Fused symbol-level variants (single round-trip path in the handlers)
+
+    def get_latest_snapshot_by_symbol(self, ticker: str, country: str):
+        return self._latest if ticker == "FOUND" else None
+
+    def get_snapshots_range_by_symbol(self, ticker: str, country: str, fr, to, limit: int, order: str):
+        return self._snapshots if ticker == "FOUND" else []
+
+    def get_snapshots_range_json(self, ticker: str, country: str, fr, to, limit: int, order: str):
+        if ticker != "FOUND":
+            return 0, "[]"
+        return len(self._snapshots), json.dumps(self._snapshots)
+
 
 @pytest.fixture
 def app(monkeypatch):
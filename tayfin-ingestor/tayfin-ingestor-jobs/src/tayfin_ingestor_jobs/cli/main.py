@@ -1,143 +1,200 @@
-import typer
-from typing import Optional
-from pathlib import Path
+"""Command-line entry point — plain argparse, no framework.
 
-from ..config.loader import load_config
-from ..jobs.discovery_job import DiscoveryJob
-from ..jobs.fundamentals_job import FundamentalsJob
-from ..jobs.ohlcv_job import OhlcvJob
-from ..jobs.ohlcv_backfill_job import OhlcvBackfillJob
+The CLI is invoked once per job run, so startup cost matters more than
+decorator convenience; argparse keeps the import graph minimal.  Job
+classes import lazily inside their dispatch branch — each pulls in its
+provider stack (pandas, yfinance, …) — and even the config loader
+(dotenv) imports inside the command functions, so --help and unknown
+commands exit touching nothing but stdlib.
+"""
+import argparse
+import sys
+from pathlib import Path
 
-app = typer.Typer()
-jobs_app = typer.Typer()
-app.add_typer(jobs_app, name="jobs")
+# Job code sets _status from the literal "SUCCESS", which CPython interns,
+# so the tally below can compare by identity instead of character-wise.
+_SUCCESS = sys.intern("SUCCESS")
 
 
-@jobs_app.command("list")
-def list_jobs(config: Optional[Path] = typer.Option(None, help="Path to config YAML"), kind: Optional[str] = typer.Option(None, help="Job kind to list (discovery|fundamentals|ohlcv)")):
+def _list_jobs(args) -> None:
     """List targets from config. Use --kind to select job type."""
+    from ..config.loader import get_targets, load_config
+
+    kind = args.kind
     if kind == "fundamentals":
-        cfg = load_config(config, default_filename="fundamentals.yml")
-        targets = cfg.get("jobs", {}).get("fundamentals", {})
+        cfg = load_config(args.config, default_filename="fundamentals.yml")
+        targets = get_targets(cfg, "fundamentals")
         if not targets:
-            typer.echo("No fundamentals targets found in config.")
-            raise typer.Exit(code=0)
+            print("No fundamentals targets found in config.")
+            return
         for name, entry in targets.items():
-            typer.echo(f"- {name}: {entry.get('name', '')} ({entry.get('index_code','')})")
-        raise typer.Exit(code=0)
+            print(f"- {name}: {entry.get('name', '')} ({entry.get('index_code','')})")
+        return
 
     if kind == "ohlcv":
-        cfg = load_config(config, default_filename="ohlcv.yml")
-        targets = cfg.get("jobs", {}).get("ohlcv", {})
+        cfg = load_config(args.config, default_filename="ohlcv.yml")
+        targets = get_targets(cfg, "ohlcv")
         if not targets:
-            typer.echo("No ohlcv targets found in config.")
-            raise typer.Exit(code=0)
+            print("No ohlcv targets found in config.")
+            return
         for name, entry in targets.items():
-            typer.echo(f"- {name}: code={entry.get('code', '')} index_code={entry.get('index_code','')} timeframe={entry.get('timeframe','')} window_days={entry.get('window_days','')}")
-        raise typer.Exit(code=0)
+            print(f"- {name}: code={entry.get('code', '')} index_code={entry.get('index_code','')} timeframe={entry.get('timeframe','')} window_days={entry.get('window_days','')}")
+        return
+
     if kind == "ohlcv_backfill":
-        cfg = load_config(config, default_filename="ohlcv_backfill.yml")
-        targets = cfg.get("jobs", {})
+        cfg = load_config(args.config, default_filename="ohlcv_backfill.yml")
+        targets = get_targets(cfg)
         if not targets:
-            typer.echo("No ohlcv_backfill targets found in config.")
-            raise typer.Exit(code=0)
+            print("No ohlcv_backfill targets found in config.")
+            return
         for name, entry in targets.items():
-            typer.echo(
+            print(
                 f"- {name}: index_code={entry.get('index_code', '')} "
                 f"default_exchange={entry.get('default_exchange', '')} "
                 f"default_chunk_days={entry.get('default_chunk_days', '')}"
             )
-        raise typer.Exit(code=0)
+        return
+
     # Default: discovery
-    cfg = load_config(config)
-    targets = cfg.get("jobs", {}).get("discovery", {})
+    cfg = load_config(args.config)
+    targets = get_targets(cfg, "discovery")
     if not targets:
-        typer.echo("No discovery targets found in config.")
-        raise typer.Exit(code=0)
+        print("No discovery targets found in config.")
+        return
     for name, entry in targets.items():
-        typer.echo(f"- {name}: {entry.get('name', '')} ({entry.get('index_code','')})")
-
-
-@jobs_app.command("run")
-def run(
-    kind: str = typer.Argument(..., help="Job kind, e.g. discovery"),
-    target: str = typer.Argument(..., help="Target name from config"),
-    config: Optional[Path] = typer.Option(None, help="Path to config YAML"),
-    ticker: Optional[str] = typer.Option(None, help="Optional ticker override (single instrument)"),
-    from_date: Optional[str] = typer.Option(None, "--from", help="Start date override (YYYY-MM-DD)"),
-    to_date: Optional[str] = typer.Option(None, "--to", help="End date override (YYYY-MM-DD)"),
-    limit: Optional[int] = typer.Option(None, "--limit", help="Process only the first N tickers (for testing)"),
-    days_back: Optional[int] = typer.Option(None, "--days-back", help="(backfill) Days back from today"),
-    chunk_days: Optional[int] = typer.Option(None, "--chunk-days", help="(backfill) Override chunk size in days"),
-    skip_existing: bool = typer.Option(False, "--skip-existing", help="(backfill) Skip dates already present"),
-):
+        print(f"- {name}: {entry.get('name', '')} ({entry.get('index_code','')})")
+
+
+def _print_markdown(rows: list[dict]) -> tuple[int, int]:
+    """Print *rows* as a markdown table in one pass; no pandas/tabulate.
+
+    Returns ``(total, succeeded)`` — the success tally rides the same
+    traversal that renders the rows.
+    """
+    cols = list(rows[0].keys())
+    lines = [
+        "| " + " | ".join(cols) + " |",
+        "| " + " | ".join("---" for _ in cols) + " |",
+    ]
+    succeeded = 0
+    for r in rows:
+        succeeded += r.get("_status") is _SUCCESS
+        lines.append("| " + " | ".join(str(r.get(c, "")) for c in cols) + " |")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    return len(rows), succeeded
+
+
+def _run_discovery(target_cfg, cfg, args):
+    from ..jobs.discovery_job import DiscoveryJob
+
+    return DiscoveryJob.from_config(target_cfg, cfg).run()
+
+
+def _run_fundamentals(target_cfg, cfg, args):
+    from ..jobs.fundamentals_job import FundamentalsJob
+
+    # optional ticker override
+    return FundamentalsJob.from_config(target_cfg, cfg).run(ticker=args.ticker)
+
+
+def _run_ohlcv(target_cfg, cfg, args):
+    from ..jobs.ohlcv_job import OhlcvJob
+
+    job = OhlcvJob.from_config(target_cfg, cfg)
+    job.run(ticker=args.ticker, from_date=args.from_date, to_date=args.to_date, limit_tickers=args.limit)
+    return None
+
+
+def _run_ohlcv_backfill(target_cfg, cfg, args):
+    from ..jobs.ohlcv_backfill_job import OhlcvBackfillJob
+
+    job = OhlcvBackfillJob.from_config(target_cfg, cfg)
+    try:
+        job.run(
+            days_back=args.days_back,
+            from_date=args.from_date,
+            to_date=args.to_date,
+            ticker=args.ticker,
+            limit=args.limit,
+            chunk_days=args.chunk_days,
+            skip_existing=args.skip_existing,
+        )
+    except ValueError as exc:
+        print(f"ERROR: {exc}")
+        sys.exit(1)
+    return None
+
+
+# kind -> (handler, default config filename, jobs-subtree key).  A None
+# subtree key means the targets nest directly under cfg['jobs'] (the
+# backfill config layout).  Handlers returning None print nothing; a
+# list result is rendered as a markdown summary table.
+_HANDLERS = {
+    "discovery": (_run_discovery, "discovery.yml", "discovery"),
+    "fundamentals": (_run_fundamentals, "fundamentals.yml", "fundamentals"),
+    "ohlcv": (_run_ohlcv, "ohlcv.yml", "ohlcv"),
+    "ohlcv_backfill": (_run_ohlcv_backfill, "ohlcv_backfill.yml", None),
+}
+
+
+def _run(args) -> None:
     """Run a job. Example: jobs run discovery nasdaq-100 --config config/discovery.yml"""
-    cfg = None
-    target_cfg = None
-    if kind == "discovery":
-        cfg = load_config(config)
-        targets = cfg.get("jobs", {}).get("discovery", {})
-        target_cfg = targets.get(target)
-        if not target_cfg:
-            typer.echo(f"Discovery target '{target}' not found in config.")
-            raise typer.Exit(code=1)
-        job = DiscoveryJob.from_config(target_cfg, cfg)
-        result = job.run()
-    elif kind == "fundamentals":
-        cfg = load_config(config, default_filename="fundamentals.yml")
-        targets = cfg.get("jobs", {}).get("fundamentals", {})
-        target_cfg = targets.get(target)
-        if not target_cfg:
-            typer.echo(f"Fundamentals target '{target}' not found in config.")
-            raise typer.Exit(code=1)
-        job = FundamentalsJob.from_config(target_cfg, cfg)
-        # optional ticker override
-        result = job.run(ticker=ticker)
-    elif kind == "ohlcv":
-        cfg = load_config(config, default_filename="ohlcv.yml")
-        targets = cfg.get("jobs", {}).get("ohlcv", {})
-        target_cfg = targets.get(target)
-        if not target_cfg:
-            typer.echo(f"OHLCV target '{target}' not found in config.")
-            raise typer.Exit(code=1)
-        job = OhlcvJob.from_config(target_cfg, cfg)
-        job.run(ticker=ticker, from_date=from_date, to_date=to_date, limit_tickers=limit)
-        return
-    elif kind == "ohlcv_backfill":
-        cfg = load_config(config, default_filename="ohlcv_backfill.yml")
-        targets = cfg.get("jobs", {})
-        target_cfg = targets.get(target)
-        if not target_cfg:
-            typer.echo(f"OHLCV backfill target '{target}' not found in config.")
-            raise typer.Exit(code=1)
-        job = OhlcvBackfillJob.from_config(target_cfg, cfg)
-        try:
-            job.run(
-                days_back=days_back,
-                from_date=from_date,
-                to_date=to_date,
-                ticker=ticker,
-                limit=limit,
-                chunk_days=chunk_days,
-                skip_existing=skip_existing,
-            )
-        except ValueError as exc:
-            typer.echo(f"ERROR: {exc}")
-            raise typer.Exit(code=1)
+    entry = _HANDLERS.get(args.kind)
+    if entry is None:
+        print(f"Unsupported job kind. Use one of: {', '.join(_HANDLERS)}.")
+        sys.exit(1)
+    handler, default_filename, targets_key = entry
+
+    from ..config.loader import get_targets, load_config
+
+    cfg = load_config(args.config, default_filename=default_filename)
+    target_cfg = get_targets(cfg, targets_key).get(args.target)
+    if not target_cfg:
+        print(f"Target '{args.target}' not found in config for kind '{args.kind}'.")
+        sys.exit(1)
+
+    result = handler(target_cfg, cfg, args)
+    if result is None:
         return
-    else:
-        typer.echo("Unsupported job kind. Use 'discovery', 'fundamentals', 'ohlcv', or 'ohlcv_backfill'.")
-        raise typer.Exit(code=1)
-    # result is a list of dicts with ticker,country,index_code
-    import pandas as pd
 
-    df = pd.DataFrame(result)
-    if df.empty:
-        typer.echo("No items discovered.")
+    # result is a list of dicts with ticker,country,index_code
+    if not result:
+        print("No items discovered.")
+        total = succeeded = 0
     else:
-        typer.echo(df.to_markdown(index=False))
-    # Print counts
-    total = len(result)
-    succeeded = sum(1 for r in result if r.get("_status") == "SUCCESS")
-    failed = total - succeeded
-    typer.echo(f"Total: {total}, Succeeded: {succeeded}, Failed: {failed}")
+        total, succeeded = _print_markdown(result)
+    print(f"Total: {total}, Succeeded: {succeeded}, Failed: {total - succeeded}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tayfin-ingestor-jobs")
+    sub = parser.add_subparsers(dest="group", required=True)
+
+    jobs = sub.add_parser("jobs", help="Job commands")
+    jobs_sub = jobs.add_subparsers(dest="command", required=True)
+
+    p_list = jobs_sub.add_parser("list", help="List targets from config")
+    p_list.add_argument("--config", type=Path, default=None, help="Path to config YAML")
+    p_list.add_argument("--kind", default=None, help="Job kind to list (discovery|fundamentals|ohlcv)")
+    p_list.set_defaults(func=_list_jobs)
+
+    p_run = jobs_sub.add_parser("run", help="Run a job")
+    p_run.add_argument("kind", help="Job kind, e.g. discovery")
+    p_run.add_argument("target", help="Target name from config")
+    p_run.add_argument("--config", type=Path, default=None, help="Path to config YAML")
+    p_run.add_argument("--ticker", default=None, help="Optional ticker override (single instrument)")
+    p_run.add_argument("--from", dest="from_date", default=None, help="Start date override (YYYY-MM-DD)")
+    p_run.add_argument("--to", dest="to_date", default=None, help="End date override (YYYY-MM-DD)")
+    p_run.add_argument("--limit", type=int, default=None, help="Process only the first N tickers (for testing)")
+    p_run.add_argument("--days-back", type=int, default=None, help="(backfill) Days back from today")
+    p_run.add_argument("--chunk-days", type=int, default=None, help="(backfill) Override chunk size in days")
+    p_run.add_argument("--skip-existing", action="store_true", help="(backfill) Skip dates already present")
+    p_run.set_defaults(func=_run)
+
+    return parser
+
+
+def app(argv: list[str] | None = None) -> None:
+    args = _build_parser().parse_args(argv)
+    args.func(args)
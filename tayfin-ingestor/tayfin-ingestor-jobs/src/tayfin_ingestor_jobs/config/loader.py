@@ -1,9 +1,69 @@
-from pathlib import Path
+import copy
 import os
-import yaml
-from dotenv import load_dotenv
+from collections import OrderedDict
+from pathlib import Path
+
+# .env is loaded lazily on the first load_config call, keeping module
+# import free of filesystem side effects (tests import the loader
+# without wanting a .env scan).
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _ENV_LOADED = True
+
+
+# Parsed configs keyed by resolved path, validated by (mtime, size) so an
+# edited file is re-parsed.  YAML parse time dominates config load cost;
+# a hit skips PyYAML entirely and only pays a deepcopy, which keeps
+# callers free to mutate what they get back.
+_CACHE: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+_CACHE_MAX = 100
+
 
-load_dotenv()
+def _load_yaml(p: Path) -> dict:
+    key = str(p)
+    st = p.stat()
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    # Deferred: cache hits and config-less runs never pay the yaml import.
+    import yaml
+
+    try:  # libyaml-backed loader parses 5-10x faster when available
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        import warnings
+
+        warnings.warn("PyYAML built without libyaml; config parsing will be slow")
+        from yaml import SafeLoader as _SafeLoader
+    with p.open("r") as f:
+        cfg = yaml.load(f, Loader=_SafeLoader) or {}
+    _CACHE[key] = (st.st_mtime, st.st_size, cfg)
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+    return copy.deepcopy(cfg)
+
+
+def get_targets(cfg: dict, kind: str | None = None) -> dict:
+    """Return the target mapping under ``cfg['jobs']`` for *kind*.
+
+    ``kind=None`` returns the jobs mapping itself (the ohlcv_backfill
+    config nests targets directly under ``jobs``).  Centralizes the
+    chained ``.get(..., {})`` walk so callers don't each build
+    throwaway empty dicts.
+    """
+    jobs = cfg.get("jobs") or {}
+    if kind is None:
+        return jobs
+    return jobs.get(kind) or {}
 
 
 def load_config(path: Path | None = None, default_filename: str = "discovery.yml") -> dict:
@@ -14,32 +74,32 @@ def load_config(path: Path | None = None, default_filename: str = "discovery.yml
       2. directory from env `TAYFIN_CONFIG_DIR` (if set)
       3. container-mounted `/app/config/<default_filename>`
       4. package-relative `config/<default_filename>`
+
+    Parsed files are cached in-process (mtime+size validated), so
+    repeated loads within one run don't re-parse the YAML.
     """
-    cfg = {}
+    _ensure_env()
+
     # 1: explicit path
     if path:
         p = Path(path)
         if p.exists():
-            with p.open("r") as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(p)
 
     # 2: env-config dir
     env_dir = os.environ.get("TAYFIN_CONFIG_DIR")
     if env_dir:
         p = Path(env_dir) / default_filename
         if p.exists():
-            with p.open("r") as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(p)
 
     # 3: well-known container path
     p = Path("/app/config") / default_filename
     if p.exists():
-        with p.open("r") as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml(p)
 
     # 4: package-local config
     p = Path(__file__).resolve().parents[3] / "config" / default_filename
     if p.exists():
-        with p.open("r") as f:
-            cfg = yaml.safe_load(f) or {}
-    return cfg
+        return _load_yaml(p)
+    return {}
@@ -4,16 +4,36 @@ Env var contract per ADR-05: POSTGRES_* only, postgresql+psycopg:// driver.
 Default credentials per ADR-06: tayfin_user / empty password.
 """
 
+import functools
 import os
+
 from sqlalchemy import create_engine
 
 
-def get_engine():
-    """Build a SQLAlchemy engine from environment variables."""
-    user = os.environ.get("POSTGRES_USER", "tayfin_user")
-    password = os.environ.get("POSTGRES_PASSWORD", "")
-    db = os.environ.get("POSTGRES_DB", "tayfin")
-    host = os.environ.get("POSTGRES_HOST", "localhost")
-    port = os.environ.get("POSTGRES_PORT", "5432")
+@functools.lru_cache(maxsize=4)
+def _make_engine(user: str, password: str, db: str, host: str, port: str):
+    """Build (once per credential tuple) a pooled engine.
+
+    Memoized so repeated get_engine() calls within a process share one
+    pool instead of rebuilding dialect + pool state per call; explicit
+    pool sizing and pre-ping keep connections reused and healthy across
+    the per-upsert ``engine.begin()`` blocks in the repositories.
+    """
     url = f"postgresql+psycopg://{user}:{password}@{host}:{port}/{db}"
-    return create_engine(url)
+    return create_engine(
+        url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+    )
+
+
+def get_engine():
+    """Return the SQLAlchemy engine for the current environment variables."""
+    return _make_engine(
+        os.environ.get("POSTGRES_USER", "tayfin_user"),
+        os.environ.get("POSTGRES_PASSWORD", ""),
+        os.environ.get("POSTGRES_DB", "tayfin"),
+        os.environ.get("POSTGRES_HOST", "localhost"),
+        os.environ.get("POSTGRES_PORT", "5432"),
+    )
@@ -1,16 +1,27 @@
+import atexit
 import httpx
-import pandas as pd
 import logging
+import orjson
 from typing import Iterable
 
+# Shared lazily-built client: repeated discovery calls in one process
+# reuse the pooled TCP/TLS session instead of re-handshaking per fetch.
+_CLIENT: httpx.Client | None = None
+
+
+def _get_client(timeout: float) -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(timeout=timeout, follow_redirects=True)
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
 
 class NasdaqTraderIndexDiscoveryProvider:
     """Provider that fetches NASDAQ-100 constituents from Nasdaq API.
 
-    The provider returns a pandas.DataFrame internally but exposes a
-    discover(...) method that returns an iterable of dicts (records),
-    and also keeps the DataFrame available via `last_dataframe` for
-    consumers that need it.
+    discover(...) returns a list of record dicts; the symbol extraction
+    is a single pure-Python pass over the API rows.
     """
 
     URL = "https://api.nasdaq.com/api/quote/list-type/nasdaq100"
@@ -22,24 +33,27 @@ class NasdaqTraderIndexDiscoveryProvider:
 
     def __init__(self, timeout: float = 15.0):
         self.timeout = timeout
-        self.last_dataframe: pd.DataFrame | None = None
 
     def _fetch_json(self) -> list[dict]:
-        with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-            resp = client.get(self.URL, headers=self.HEADERS)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to fetch NASDAQ-100 list: HTTP {resp.status_code}")
-        payload = resp.json()
+        # Stream the body into one buffer instead of client.get()'s
+        # eager .content: chunks arrive as they download, and the
+        # response object never retains its own copy of the bytes —
+        # peak memory is the buffer plus the parsed payload, not both
+        # plus httpx's internal content cache.  orjson then decodes the
+        # raw bytes in a single native pass (no charset sniffing, no
+        # stdlib json).
+        with _get_client(self.timeout).stream("GET", self.URL, headers=self.HEADERS) as resp:
+            if resp.status_code != 200:
+                raise RuntimeError(f"Failed to fetch NASDAQ-100 list: HTTP {resp.status_code}")
+            body = b"".join(resp.iter_bytes(65536))
+        payload = orjson.loads(body)
         rows = payload.get("data", {}).get("data", {}).get("rows")
         if not rows:
             raise RuntimeError("No rows found in NASDAQ API response")
         return rows
 
     def discover(self, target_cfg: dict) -> Iterable[dict]:
-        """Discover returns an iterable of dicts (to satisfy the job interface).
-
-        It also stores a DataFrame in `last_dataframe` matching the spec.
-        """
+        """Discover returns a list of record dicts (job interface)."""
         rows = self._fetch_json()
 
         country = target_cfg.get("country", "US")
@@ -51,13 +65,13 @@ class NasdaqTraderIndexDiscoveryProvider:
             if symbol:
                 tickers.append(symbol)
 
-        df = pd.DataFrame({"ticker": tickers})
-        df = df.drop_duplicates(subset=["ticker"])
-        df["country"] = country
-        df["index_code"] = index_code
-        df = df[["ticker", "country", "index_code"]].copy()
-
-        self.last_dataframe = df
-        logging.info(f"Discovered {len(df)} tickers from Nasdaq API for {index_code}")
+        # dict.fromkeys dedupes while preserving first-occurrence order,
+        # matching the old drop_duplicates behaviour without the
+        # DataFrame round-trip.
+        result = [
+            {"ticker": t, "country": country, "index_code": index_code}
+            for t in dict.fromkeys(tickers)
+        ]
+        logging.info(f"Discovered {len(result)} tickers from Nasdaq API for {index_code}")
 
-        return df
+        return result
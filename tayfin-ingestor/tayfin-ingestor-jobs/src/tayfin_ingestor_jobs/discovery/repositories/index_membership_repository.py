@@ -18,3 +18,25 @@ class IndexMembershipRepository:
             res = conn.execute(stmt, {"index_code": index_code, "instrument_id": instrument_id, "country": country, "effective_date": effective_date, "created_by_job_run_id": created_by_job_run_id, "updated_by_job_run_id": updated_by_job_run_id})
             row = res.fetchone()
             return str(row[0])
+
+    def upsert_many(self, rows: list[dict]) -> int:
+        """Upsert a batch of memberships in one transaction.
+
+        Each row needs index_code, instrument_id, country, effective_date,
+        created_by_job_run_id and (optionally None) updated_by_job_run_id.
+        Passing the list to execute() uses psycopg's executemany path —
+        one BEGIN/COMMIT and one prepared plan for the whole batch
+        instead of a round-trip per membership.
+        """
+        if not rows:
+            return 0
+        stmt = text(
+            """
+            INSERT INTO tayfin_ingestor.index_memberships (index_code, instrument_id, country, effective_date, created_at, updated_at, created_by_job_run_id, updated_by_job_run_id)
+            VALUES (:index_code, :instrument_id, :country, :effective_date, now(), now(), :created_by_job_run_id, :updated_by_job_run_id)
+            ON CONFLICT (index_code, instrument_id) DO UPDATE SET country = EXCLUDED.country, effective_date = EXCLUDED.effective_date, updated_at = now(), updated_by_job_run_id = EXCLUDED.updated_by_job_run_id
+            """
+        )
+        with self.engine.begin() as conn:
+            conn.execute(stmt, rows)
+        return len(rows)
@@ -8,3 +8,11 @@ class IFundamentalsProvider(Protocol):
         Returns a dict whose keys match the columns in `fundamentals_snapshots`.
        """
         ...
+
+    def compute_many(self, rows: list[tuple[str, str]]) -> list[dict]:
+        """Compute fundamentals for many (ticker, country) pairs.
+
+        Returns one dict per pair in input order; a failed pair yields
+        ``{"error": <message>}`` instead of raising.
+        """
+        ...
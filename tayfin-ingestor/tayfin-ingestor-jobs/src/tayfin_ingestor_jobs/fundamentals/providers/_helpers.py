@@ -1,10 +1,16 @@
 """Shared helpers for fundamentals providers."""
 from __future__ import annotations
 
+import re
 from typing import Any, Optional
 
 import pandas as pd
 
+# One C-level match replaces the chained endswith checks for
+# suffix-formatted values ("1.2B", "-3.5M", "150K").
+_SUFFIX_RE = re.compile(r"^([-+]?\d*\.?\d+)([BMK])?$")
+_SUFFIX_MULT = {"B": 1e9, "M": 1e6, "K": 1e3, None: 1.0}
+
 
 def safe_float(val: Any) -> Optional[float]:
     """Convert *val* to float safely; return None on failure."""
@@ -16,15 +22,19 @@ def safe_float(val: Any) -> Optional[float]:
                 return None
             return float(val)
         if isinstance(val, str):
+            # Fast path: plain numeric strings ("123.45") need none of
+            # the normalization below, and float() already tolerates
+            # surrounding whitespace.
+            try:
+                return float(val)
+            except ValueError:
+                pass
             v = val.strip().replace(",", "").upper()
             if v in ("", "N/A", "NONE"):
                 return None
-            if v.endswith("B"):
-                return float(v[:-1]) * 1_000_000_000
-            if v.endswith("M"):
-                return float(v[:-1]) * 1_000_000
-            if v.endswith("K"):
-                return float(v[:-1]) * 1_000
+            m = _SUFFIX_RE.match(v)
+            if m:
+                return float(m.group(1)) * _SUFFIX_MULT[m.group(2)]
             return float(v)
         return float(val)
     except Exception:
@@ -5,8 +5,16 @@ standard fundamental metrics. Falls back to yfinance if Stockdex fails.
 """
 from __future__ import annotations
 
+import copy
+import functools
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import date
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -17,63 +25,159 @@ from ._yfinance_fallback import yfinance_fallback
 
 logger = logging.getLogger(__name__)
 
+# Caps tickers in flight against Yahoo regardless of how wide a
+# compute_many pool is sized — enough concurrency to hide latency,
+# throttled enough to stay under rate limits.
+_YAHOO_SEMAPHORE = threading.Semaphore(8)
 
-# ---------------------------------------------------------------------------
-# DataFrame helpers
-# ---------------------------------------------------------------------------
+# Warm shared pool for the per-ticker dataset fetches: sized to the
+# semaphore width times the four datasets per ticker, so no fetch ever
+# queues behind pool capacity, and no compute() call pays thread
+# spawn/join for its own four-worker pool.  Distinct from the
+# compute_many pool — nesting both on one executor could deadlock.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="stockdex-fetch")
 
-def _pick_field(df: Optional[pd.DataFrame], candidates: List[str]) -> Optional[str]:
-    """Return the first column name from *candidates* that exists in *df*."""
-    if df is None:
-        return None
-    for c in candidates:
-        if c in df.columns:
-            return c
-    return None
+# The yfinance fallback retries with backoff and can block for many
+# seconds; it runs on its own small pool so compute() can bound how long
+# it waits for a result instead of inheriting the full retry schedule.
+_FALLBACK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yf-fallback")
+_FALLBACK_TIMEOUT = 15.0
 
 
-def _latest(df: Optional[pd.DataFrame], field: Any) -> Optional[float]:
-    """Extract the latest (first-row) value for *field* from *df*."""
-    if df is None or df.empty:
-        return None
-    if isinstance(field, list):
-        for f in field:
-            if f in df.columns:
-                v = safe_float(df[f].iloc[0])
-                if v is not None:
-                    return v
-        return None
-    if field in df.columns:
-        return safe_float(df[field].iloc[0])
-    return None
+@functools.lru_cache(maxsize=4096)
+def _normalize_symbol(ticker: str) -> str:
+    """Strip an exchange prefix (\"US:AAPL\" -> \"AAPL\") in one C call.
 
+    Also the canonical form for cache keys, so prefixed and bare
+    spellings of the same symbol share a slot.
+    """
+    sym = ticker.rpartition(":")[2]
+    return sym if sym else ticker
 
-def _ttm(df: Optional[pd.DataFrame], field: str) -> Optional[float]:
-    """Sum the last 4 quarters (trailing-twelve-months) for *field*."""
-    if df is None or field not in df.columns:
-        return None
-    vals = [safe_float(x) for x in df[field].iloc[:4]]
-    vals = [v for v in vals if v is not None]
-    return sum(vals) if vals else None
 
+# ---------------------------------------------------------------------------
+# Column extraction — one vectorized pass per DataFrame
+# ---------------------------------------------------------------------------
 
-def _prior_ttm(df: Optional[pd.DataFrame], field: str) -> Optional[float]:
-    """Sum quarters 5-8 (prior-year TTM) for *field*."""
-    if df is None or field not in df.columns:
-        return None
-    if len(df[field]) < 8:
-        return None
-    vals = [safe_float(x) for x in df[field].iloc[4:8]]
-    vals = [v for v in vals if v is not None]
-    return sum(vals) if vals else None
+# Union of every column the resolvers below may consult, hoisted so the
+# extraction pass knows what to pull from each fetched DataFrame.
+_INCOME_COLS = (
+    "quarterlyBasicEPS",
+    "quarterlyDilutedEPS",
+    "annualDilutedEPS",
+    "annualBasicEPS",
+    "quarterlyNetIncome",
+    "annualNetIncome",
+    "quarterlyTotalRevenue",
+    "annualTotalRevenue",
+)
+_BALANCE_COLS = (
+    "quarterlyOrdinarySharesNumber",
+    "quarterlySharesOutstanding",
+    "quarterlyCommonStockSharesOutstanding",
+    "annualOrdinarySharesNumber",
+    "annualBasicAverageShares",
+    "quarterlyTangibleBookValue",
+    "annualTangibleBookValue",
+    "quarterlyNetTangibleAssets",
+    "quarterlyTotalDebt",
+    "annualTotalDebt",
+    "quarterlyLongTermDebt",
+    "annualLongTermDebt",
+    "quarterlyStockholdersEquity",
+    "annualStockholdersEquity",
+    "annualTotalEquityGrossMinorityInterest",
+)
+
+# Placeholder tuple for absent columns: (latest, ttm, prior_ttm).
+_MISSING = (None, None, None)
+
+# A metrics map: column name -> (latest, ttm, prior_ttm) floats.
+Metrics = Dict[str, tuple]
+
+
+def _extract_metrics(df: Optional[pd.DataFrame], cols: tuple) -> Metrics:
+    """Coerce each present column once and precompute its three views.
+
+    Every resolver candidate reduces to latest value, 4-quarter TTM sum
+    or prior-year TTM sum, so one pass over the first 8 rows per column
+    covers them all — the resolvers then do plain dict lookups instead
+    of re-slicing the same DataFrames per candidate.  pd.to_numeric
+    coerces in C; object columns fall back to per-cell safe_float for
+    suffix-formatted strings (\"1.2B\").
+    """
+    out: Metrics = {}
+    if df is None or df.empty:
+        return out
+    has_prior = len(df) >= 8
+    # One set build replaces an Index.__contains__ per candidate column.
+    present = set(df.columns)
+    for c in cols:
+        if c not in present:
+            continue
+        window = df[c].iloc[:8]
+        kind = window.dtype.kind
+        if kind in "fiu":
+            # Already numeric (the usual case for yahoo_api_* fields):
+            # a per-cell NaN check beats a to_numeric pass that would
+            # only copy the data.
+            vals = [None if v != v else float(v) for v in window.to_numpy()]
+        elif kind == "O":
+            vals = [safe_float(x) for x in window]
+        else:
+            vals = [None if pd.isna(v) else float(v) for v in pd.to_numeric(window, errors="coerce")]
+        latest = vals[0] if vals else None
+        head = [v for v in vals[:4] if v is not None]
+        ttm = sum(head) if head else None
+        prior = None
+        if has_prior:
+            tail = [v for v in vals[4:8] if v is not None]
+            prior = sum(tail) if tail else None
+        out[c] = (latest, ttm, prior)
+    return out
 
 
 # ---------------------------------------------------------------------------
 # Metric resolvers — each returns (value, trace_dict)
 # ---------------------------------------------------------------------------
 
-def _resolve_eps(inc: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
-    trace: dict = {"tried": []}
+class _NullList:
+    __slots__ = ()
+
+    def append(self, item) -> None:
+        pass
+
+
+_NULL_LIST = _NullList()
+
+
+class _NullTrace(dict):
+    """Inert trace sink: accepts writes and appends, stores nothing."""
+
+    def __setitem__(self, key, value) -> None:
+        pass
+
+    def __getitem__(self, key):
+        return _NULL_LIST
+
+
+_NULL_TRACE = _NullTrace()
+
+
+def _new_trace(with_tried: bool = True) -> dict:
+    """Return a real trace dict, or the inert sink when tracing is off.
+
+    Tracing exists for debugging metric provenance; with it disabled
+    (the default) the resolvers stop accumulating dozens of small dicts
+    per ticker that the compute cache would then deep-copy twice.
+    """
+    if not StockdexProvider.TRACE:
+        return _NULL_TRACE
+    return {"tried": []} if with_tried else {}
+
+
+def _resolve_eps(inc_m: Metrics) -> tuple[Optional[float], dict]:
+    trace = _new_trace()
     candidates = [
         ("quarterlyBasicEPS", True),
         ("quarterlyDilutedEPS", True),
@@ -81,11 +185,12 @@ def _resolve_eps(inc: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
         ("annualBasicEPS", False),
     ]
     for col, is_quarterly in candidates:
+        latest, ttm, _ = inc_m.get(col, _MISSING)
         if is_quarterly:
-            val = _ttm(inc, col)
+            val = ttm
             trace["tried"].append({"column": col, "method": "ttm", "value": val})
         else:
-            val = _latest(inc, col)
+            val = latest
             trace["tried"].append({"column": col, "method": "latest", "value": val})
         if val not in (None, 0):
             trace["chosen"] = col
@@ -93,8 +198,8 @@ def _resolve_eps(inc: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
     return None, trace
 
 
-def _resolve_shares(bal: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
-    trace: dict = {"tried": []}
+def _resolve_shares(bal_m: Metrics) -> tuple[Optional[float], dict]:
+    trace = _new_trace()
     candidates = [
         "quarterlyOrdinarySharesNumber",
         "quarterlySharesOutstanding",
@@ -103,7 +208,7 @@ def _resolve_shares(bal: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]
         "annualBasicAverageShares",
     ]
     for col in candidates:
-        val = _latest(bal, col)
+        val = bal_m.get(col, _MISSING)[0]
         trace["tried"].append({"column": col, "value": val})
         if val not in (None, 0):
             trace["chosen"] = col
@@ -111,11 +216,11 @@ def _resolve_shares(bal: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]
     return None, trace
 
 
-def _resolve_bvps(bal: Optional[pd.DataFrame], shares: Optional[float]) -> tuple[Optional[float], dict]:
-    trace: dict = {"tried": []}
+def _resolve_bvps(bal_m: Metrics, shares: Optional[float]) -> tuple[Optional[float], dict]:
+    trace = _new_trace()
     candidates = ["quarterlyTangibleBookValue", "annualTangibleBookValue", "quarterlyNetTangibleAssets"]
     for col in candidates:
-        val = _latest(bal, col)
+        val = bal_m.get(col, _MISSING)[0]
         trace["tried"].append({"column": col, "value": val})
         if val not in (None, 0) and shares not in (None, 0):
             trace["chosen"] = col
@@ -123,11 +228,11 @@ def _resolve_bvps(bal: Optional[pd.DataFrame], shares: Optional[float]) -> tuple
     return None, trace
 
 
-def _resolve_single(df: Optional[pd.DataFrame], candidates: List[str]) -> tuple[Optional[float], dict]:
+def _resolve_single(m: Metrics, candidates: List[str]) -> tuple[Optional[float], dict]:
     """Pick the first non-null latest value from *candidates*."""
-    trace: dict = {"tried": []}
+    trace = _new_trace()
     for col in candidates:
-        val = _latest(df, col)
+        val = m.get(col, _MISSING)[0]
         trace["tried"].append({"column": col, "value": val})
         if val is not None:
             trace["chosen"] = col
@@ -135,15 +240,15 @@ def _resolve_single(df: Optional[pd.DataFrame], candidates: List[str]) -> tuple[
     return None, trace
 
 
-def _resolve_ttm_metric(inc: Optional[pd.DataFrame], q_col: str, a_col: str) -> tuple[Optional[float], dict]:
+def _resolve_ttm_metric(inc_m: Metrics, q_col: str, a_col: str) -> tuple[Optional[float], dict]:
     """Resolve a TTM metric: try quarterly TTM first, then annual latest."""
-    trace: dict = {"tried": []}
-    val = _ttm(inc, q_col)
+    trace = _new_trace()
+    val = inc_m.get(q_col, _MISSING)[1]
     trace["tried"].append({"column": q_col, "method": "ttm", "value": val})
     if val not in (None, 0):
         trace["chosen"] = q_col
         return val, trace
-    val = _latest(inc, a_col)
+    val = inc_m.get(a_col, _MISSING)[0]
     trace["tried"].append({"column": a_col, "method": "latest", "value": val})
     if val not in (None, 0):
         trace["chosen"] = a_col
@@ -151,19 +256,18 @@ def _resolve_ttm_metric(inc: Optional[pd.DataFrame], q_col: str, a_col: str) ->
     return None, trace
 
 
-def _resolve_revenue(inc: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
-    trace: dict = {"tried": []}
-    val = _ttm(inc, "quarterlyTotalRevenue")
-    trace["tried"].append({"column": "quarterlyTotalRevenue", "method": "ttm", "value": val})
-    if val not in (None, 0):
+def _resolve_revenue(inc_m: Metrics) -> tuple[Optional[float], dict]:
+    trace = _new_trace()
+    q_latest, q_ttm, _ = inc_m.get("quarterlyTotalRevenue", _MISSING)
+    trace["tried"].append({"column": "quarterlyTotalRevenue", "method": "ttm", "value": q_ttm})
+    if q_ttm not in (None, 0):
         trace["chosen"] = "quarterlyTotalRevenue (ttm)"
-        return val, trace
-    val = _latest(inc, "quarterlyTotalRevenue")
-    trace["tried"].append({"column": "quarterlyTotalRevenue", "method": "latest", "value": val})
-    if val not in (None, 0):
+        return q_ttm, trace
+    trace["tried"].append({"column": "quarterlyTotalRevenue", "method": "latest", "value": q_latest})
+    if q_latest not in (None, 0):
         trace["chosen"] = "quarterlyTotalRevenue (latest)"
-        return val, trace
-    val = _latest(inc, "annualTotalRevenue")
+        return q_latest, trace
+    val = inc_m.get("annualTotalRevenue", _MISSING)[0]
     trace["tried"].append({"column": "annualTotalRevenue", "method": "latest", "value": val})
     if val not in (None, 0):
         trace["chosen"] = "annualTotalRevenue"
@@ -172,7 +276,7 @@ def _resolve_revenue(inc: Optional[pd.DataFrame]) -> tuple[Optional[float], dict
 
 
 def _resolve_growth(
-    inc_q: Optional[pd.DataFrame],
+    inc_m: Metrics,
     inc_a: Optional[pd.DataFrame],
     q_col: str,
     a_col: str,
@@ -182,11 +286,10 @@ def _resolve_growth(
     Strategy 1: quarterly TTM (rows 0-3) vs prior-year TTM (rows 4-7).
     Strategy 2: annual income statement — latest vs previous year.
     """
-    trace: dict = {}
+    trace = _new_trace(with_tried=False)
 
     # Strategy 1 — quarterly TTM vs prior TTM
-    current = _ttm(inc_q, q_col)
-    prior = _prior_ttm(inc_q, q_col)
+    _, current, prior = inc_m.get(q_col, _MISSING)
     trace["quarterly_ttm"] = current
     trace["prior_quarterly_ttm"] = prior
     if current not in (None, 0) and prior not in (None, 0):
@@ -195,11 +298,20 @@ def _resolve_growth(
 
     # Strategy 2 — annual DataFrame (separate fetch)
     if inc_a is not None and a_col in inc_a.columns:
-        vals = inc_a[a_col].tolist()
-        # vals are ordered oldest→newest (index is date-ascending)
-        # pick the last two non-null values
-        valid = [(i, safe_float(v)) for i, v in enumerate(vals) if safe_float(v) not in (None, 0)]
-        trace["annual_values"] = [(i, v) for i, v in valid]
+        # values are ordered oldest→newest (index is date-ascending);
+        # pick the last two non-null, non-zero values.  Coercion runs
+        # vectorized except for object columns, whose suffix-formatted
+        # strings need per-cell safe_float.
+        col = inc_a[a_col]
+        if col.dtype == object:
+            coerced = [safe_float(v) for v in col]
+            valid = [(i, v) for i, v in enumerate(coerced) if v not in (None, 0)]
+        else:
+            s = col if col.dtype.kind in "fiu" else pd.to_numeric(col, errors="coerce")
+            vals = s.to_numpy()
+            pos = (s.notna() & (s != 0)).to_numpy().nonzero()[0]
+            valid = [(int(i), float(vals[i])) for i in pos]
+        trace["annual_values"] = valid
         if len(valid) >= 2:
             a_prev_val = valid[-2][1]
             a_now_val = valid[-1][1]
@@ -211,20 +323,98 @@ def _resolve_growth(
     return None, trace
 
 
-def _resolve_price(ticker_obj) -> tuple[Optional[float], dict]:
-    trace: dict = {}
+def _fetch_price_df(ticker_obj) -> Optional[pd.DataFrame]:
     try:
-        price_df = ticker_obj.yahoo_api_price(range="1mo", dataGranularity="1d")
-        if price_df is not None and not price_df.empty and "close" in price_df.columns:
-            price = safe_float(price_df["close"].iloc[-1])
-            trace["chosen"] = "yahoo_api_price.close"
-            trace["value"] = price
-            return price, trace
+        return ticker_obj.yahoo_api_price(range="1mo", dataGranularity="1d")
     except Exception:
-        pass
+        return None
+
+
+def _resolve_price(price_df: Optional[pd.DataFrame]) -> tuple[Optional[float], dict]:
+    trace = _new_trace(with_tried=False)
+    if price_df is not None and not price_df.empty and "close" in price_df.columns:
+        # .iat skips the iloc indexer machinery for a scalar read
+        price = safe_float(price_df["close"].iat[-1])
+        trace["chosen"] = "yahoo_api_price.close"
+        trace["value"] = price
+        return price, trace
     return None, trace
 
 
+# ---------------------------------------------------------------------------
+# Disk cache
+# ---------------------------------------------------------------------------
+
+_DISK_CACHE_TTL = 6 * 3600  # fundamentals move quarterly; 6h is generous
+_DATASET_NAMES = ("fin", "inc", "bal", "inc_annual")
+
+# In-process memo for fetched datasets keyed by (symbol, day ordinal):
+# unlike the per-provider compute cache, it survives new provider
+# instances, so retries and multi-pipeline runs in one process skip the
+# network (and even the disk cache) entirely.  Bounded so a long-lived
+# process can't pin unbounded DataFrames.
+_DATASET_MEMO: OrderedDict[tuple, tuple] = OrderedDict()
+_DATASET_MEMO_MAX = 256
+
+
+def _memo_put(key: tuple, datasets: tuple) -> None:
+    _DATASET_MEMO[key] = datasets
+    if len(_DATASET_MEMO) > _DATASET_MEMO_MAX:
+        _DATASET_MEMO.popitem(last=False)
+
+
+def clear_caches() -> None:
+    """Reset module-level caches (test isolation)."""
+    _DATASET_MEMO.clear()
+    _normalize_symbol.cache_clear()
+
+
+class _FundamentalsDiskCache:
+    """Parquet cache for fetched Yahoo datasets, keyed by (symbol, day).
+
+    Opt-in via TAYFIN_FUNDAMENTALS_CACHE=1; files live under
+    $TAYFIN_CACHE_DIR/fundamentals/{symbol}/{yyyymmdd}/.  Hits turn a
+    four-round-trip fetch into four local parquet reads.  Only complete
+    fetches (all four datasets present) are stored, so a partial Yahoo
+    outage never pins bad data for the TTL.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = os.environ.get("TAYFIN_FUNDAMENTALS_CACHE") == "1"
+        base = os.environ.get("TAYFIN_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "tayfin")
+        self.root = Path(base) / "fundamentals"
+
+    def _dir(self, sym: str) -> Path:
+        return self.root / sym / date.today().strftime("%Y%m%d")
+
+    def load(self, sym: str) -> Optional[tuple]:
+        if not self.enabled:
+            return None
+        d = self._dir(sym)
+        now = time.time()
+        out = []
+        for name in _DATASET_NAMES:
+            p = d / f"{name}.parquet"
+            try:
+                if now - p.stat().st_mtime > _DISK_CACHE_TTL:
+                    return None
+                out.append(pd.read_parquet(p))
+            except Exception:
+                return None
+        return tuple(out)
+
+    def store(self, sym: str, datasets: tuple) -> None:
+        if not self.enabled or any(df is None for df in datasets):
+            return
+        d = self._dir(sym)
+        try:
+            d.mkdir(parents=True, exist_ok=True)
+            for name, df in zip(_DATASET_NAMES, datasets):
+                df.to_parquet(d / f"{name}.parquet", compression="zstd")
+        except Exception as exc:
+            logger.debug("fundamentals disk cache write failed for %s: %s", sym, exc)
+
+
 # ---------------------------------------------------------------------------
 # Provider
 # ---------------------------------------------------------------------------
@@ -234,46 +424,76 @@ class StockdexProvider:
 
     SOURCE_ID = "stockdex_yahoo"
 
-    def _fetch_datasets(self, ticker_obj) -> tuple[
+    # Opt-in resolver tracing (TAYFIN_TRACE=1, or set
+    # StockdexProvider.TRACE = True from code, when debugging metric
+    # provenance); off by default so production runs skip the
+    # per-candidate trace allocations.
+    TRACE = os.environ.get("TAYFIN_TRACE") == "1"
+
+    def __init__(self) -> None:
+        # compute() results keyed by (ticker, country, day ordinal):
+        # fundamentals only move daily, so repeat hits within a day skip
+        # the whole fetch pipeline.  The day in the key invalidates
+        # entries at midnight without any expiry bookkeeping.
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+        self._disk_cache = _FundamentalsDiskCache()
+
+    def _fetch_datasets(self, ticker_obj, sym: str) -> tuple[
         Optional[pd.DataFrame],
         Optional[pd.DataFrame],
         Optional[pd.DataFrame],
         Optional[pd.DataFrame],
     ]:
-        """Fetch quarterly financials/income/balance + annual income statement."""
-        fin, inc, bal, inc_annual = None, None, None, None
-        for attr, freq in [
-            ("yahoo_api_financials", "quarterly"),
-            ("yahoo_api_income_statement", "quarterly"),
-            ("yahoo_api_balance_sheet", "quarterly"),
-        ]:
+        """Fetch quarterly financials/income/balance + annual income statement.
+
+        The four endpoints are independent blocking HTTP calls, so they
+        run concurrently — per-ticker fetch latency is bounded by the
+        slowest endpoint instead of the sum of all four.  Each fetch
+        swallows its own failures, so one bad endpoint degrades that
+        slot to None without affecting the others.
+
+        With the disk cache enabled, a same-day hit skips Yahoo
+        entirely and reads the four parquet files instead; the
+        in-process memo sits above both.
+        """
+        key = (sym, date.today().toordinal())
+        memo = _DATASET_MEMO.get(key)
+        if memo is not None:
+            _DATASET_MEMO.move_to_end(key)
+            return memo
+
+        cached = self._disk_cache.load(sym)
+        if cached is not None:
+            _memo_put(key, cached)
+            return cached
+
+        def fetch(attr: str, freq: str, retry_without_freq: bool):
             try:
-                df = getattr(ticker_obj, attr)(frequency=freq)
+                return getattr(ticker_obj, attr)(frequency=freq)
             except Exception:
+                if not retry_without_freq:
+                    return None
                 try:
-                    df = getattr(ticker_obj, attr)()
+                    return getattr(ticker_obj, attr)()
                 except Exception:
-                    df = None
-            if attr == "yahoo_api_financials":
-                fin = df
-            elif attr == "yahoo_api_income_statement":
-                inc = df
-            else:
-                bal = df
+                    return None
 
+        fin_f = _FETCH_POOL.submit(fetch, "yahoo_api_financials", "quarterly", True)
+        inc_f = _FETCH_POOL.submit(fetch, "yahoo_api_income_statement", "quarterly", True)
+        bal_f = _FETCH_POOL.submit(fetch, "yahoo_api_balance_sheet", "quarterly", True)
         # Annual income statement — needed for YoY growth fallback
-        try:
-            inc_annual = ticker_obj.yahoo_api_income_statement(frequency="annual")
-        except Exception:
-            inc_annual = None
+        inc_annual_f = _FETCH_POOL.submit(fetch, "yahoo_api_income_statement", "annual", False)
+        datasets = (fin_f.result(), inc_f.result(), bal_f.result(), inc_annual_f.result())
 
-        return fin, inc, bal, inc_annual
+        self._disk_cache.store(sym, datasets)
+        _memo_put(key, datasets)
+        return datasets
 
     def _compute_avg_equity(self, bal: Optional[pd.DataFrame], equity_now: Optional[float]) -> Optional[float]:
         """Average equity over 4 quarters for ROE calculation."""
         equity_4q = None
         if bal is not None and "quarterlyStockholdersEquity" in bal.columns and len(bal["quarterlyStockholdersEquity"]) >= 5:
-            equity_4q = safe_float(bal["quarterlyStockholdersEquity"].iloc[4])
+            equity_4q = safe_float(bal["quarterlyStockholdersEquity"].iat[4])
         if equity_now not in (None, 0) and equity_4q not in (None, 0):
             return (equity_now + equity_4q) / 2
         return equity_now
@@ -282,29 +502,35 @@ class StockdexProvider:
         """Primary path: compute fundamentals using Stockdex."""
         from stockdex import Ticker
 
-        sym = ticker.split(":", 1)[1] if ":" in ticker else ticker
+        sym = _normalize_symbol(ticker)
         t = Ticker(ticker=sym)
 
-        _fin, inc, bal, inc_annual = self._fetch_datasets(t)
-        trace: Dict[str, Any] = {}
+        # The price endpoint rides the same pool as the statement
+        # fetches, so the whole ticker costs one round of latency.
+        price_f = _FETCH_POOL.submit(_fetch_price_df, t)
+        _fin, inc, bal, inc_annual = self._fetch_datasets(t, sym)
+        # One coercion pass per DataFrame; resolvers below only do dict lookups.
+        inc_m = _extract_metrics(inc, _INCOME_COLS)
+        bal_m = _extract_metrics(bal, _BALANCE_COLS)
+        trace = _new_trace(with_tried=False)
 
         # Resolve individual metrics
-        eps_ttm, trace["eps_ttm"] = _resolve_eps(inc)
-        shares_out, trace["shares_out"] = _resolve_shares(bal)
-        bvps, trace["bvps"] = _resolve_bvps(bal, shares_out)
-        total_debt, trace["total_debt"] = _resolve_single(bal, ["quarterlyTotalDebt", "annualTotalDebt", "quarterlyLongTermDebt", "annualLongTermDebt"])
-        total_equity, trace["total_equity"] = _resolve_single(bal, ["quarterlyStockholdersEquity", "annualStockholdersEquity", "annualTotalEquityGrossMinorityInterest"])
-        net_income_ttm, trace["net_income_ttm"] = _resolve_ttm_metric(inc, "quarterlyNetIncome", "annualNetIncome")
-        total_revenue, trace["total_revenue"] = _resolve_revenue(inc)
-        price, trace["price"] = _resolve_price(t)
-        revenue_growth_yoy, trace["revenue_growth_yoy"] = _resolve_growth(inc, inc_annual, "quarterlyTotalRevenue", "annualTotalRevenue")
-        earnings_growth_yoy, trace["earnings_growth_yoy"] = _resolve_growth(inc, inc_annual, "quarterlyNetIncome", "annualNetIncome")
+        eps_ttm, trace["eps_ttm"] = _resolve_eps(inc_m)
+        shares_out, trace["shares_out"] = _resolve_shares(bal_m)
+        bvps, trace["bvps"] = _resolve_bvps(bal_m, shares_out)
+        total_debt, trace["total_debt"] = _resolve_single(bal_m, ["quarterlyTotalDebt", "annualTotalDebt", "quarterlyLongTermDebt", "annualLongTermDebt"])
+        total_equity, trace["total_equity"] = _resolve_single(bal_m, ["quarterlyStockholdersEquity", "annualStockholdersEquity", "annualTotalEquityGrossMinorityInterest"])
+        net_income_ttm, trace["net_income_ttm"] = _resolve_ttm_metric(inc_m, "quarterlyNetIncome", "annualNetIncome")
+        total_revenue, trace["total_revenue"] = _resolve_revenue(inc_m)
+        price, trace["price"] = _resolve_price(price_f.result())
+        revenue_growth_yoy, trace["revenue_growth_yoy"] = _resolve_growth(inc_m, inc_annual, "quarterlyTotalRevenue", "annualTotalRevenue")
+        earnings_growth_yoy, trace["earnings_growth_yoy"] = _resolve_growth(inc_m, inc_annual, "quarterlyNetIncome", "annualNetIncome")
 
         # Derived ratios
         avg_equity = self._compute_avg_equity(bal, total_equity)
         roe = div(net_income_ttm, avg_equity) * 100 if net_income_ttm not in (None, 0) and avg_equity not in (None, 0) else None
 
-        revenue_ttm = _ttm(inc, "quarterlyTotalRevenue")
+        revenue_ttm = inc_m.get("quarterlyTotalRevenue", _MISSING)[1]
         if revenue_ttm not in (None, 0) and net_income_ttm not in (None, 0):
             net_margin = div(net_income_ttm, revenue_ttm) * 100
         elif total_revenue not in (None, 0) and net_income_ttm not in (None, 0):
@@ -342,15 +568,54 @@ class StockdexProvider:
         }
 
     def compute(self, ticker: str, country: str) -> Dict[str, Any]:
-        try:
-            return self._compute_via_stockdex(ticker)
-        except Exception as exc:
-            logger.warning("Stockdex failed for %s, falling back to yfinance: %s", ticker, exc)
-            sym = ticker.split(":", 1)[1] if ":" in ticker else ticker
-            result = yfinance_fallback(sym)
-            result["source"] = self.SOURCE_ID
-            result["as_of_date"] = date.today()
-            return result
+        key = (_normalize_symbol(ticker), country, date.today().toordinal())
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Copy so callers mutating their result don't poison the cache.
+            return copy.deepcopy(cached)
+        with _YAHOO_SEMAPHORE:
+            try:
+                result = self._compute_via_stockdex(ticker)
+            except Exception as exc:
+                logger.warning("Stockdex failed for %s, falling back to yfinance: %s", ticker, exc)
+                future = _FALLBACK_POOL.submit(yfinance_fallback, _normalize_symbol(ticker))
+                try:
+                    result = future.result(timeout=_FALLBACK_TIMEOUT)
+                except FuturesTimeoutError:
+                    # The worker keeps retrying in the background, but
+                    # this ticker's latency is bounded — callers see a
+                    # failure instead of the full backoff schedule.
+                    raise RuntimeError(
+                        f"yfinance fallback timed out after {_FALLBACK_TIMEOUT:.0f}s for {ticker}"
+                    ) from exc
+                result["source"] = self.SOURCE_ID
+                result["as_of_date"] = date.today()
+        self._cache[key] = copy.deepcopy(result)
+        return result
+
+    def compute_many(self, rows: List[tuple]) -> List[Dict[str, Any]]:
+        """Compute fundamentals for many (ticker, country) pairs concurrently.
+
+        compute() is almost entirely network wait, so a thread pool runs
+        the pairs in parallel while _YAHOO_SEMAPHORE keeps total Yahoo
+        concurrency bounded.  Results come back in input order; a failed
+        pair degrades to {\"error\": ...} instead of sinking the batch.
+        """
+        if not rows:
+            return []
+
+        def one(pair):
+            ticker, country = pair
+            try:
+                return self.compute(ticker, country)
+            except Exception as exc:
+                return {"error": str(exc)}
+
+        with ThreadPoolExecutor(max_workers=min(16, len(rows))) as pool:
+            return list(pool.map(one, rows))
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
 
 
 def create_provider() -> StockdexProvider:
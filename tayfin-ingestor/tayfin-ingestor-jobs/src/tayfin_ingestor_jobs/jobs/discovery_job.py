@@ -30,7 +30,7 @@ class DiscoveryJob:
             t = Ticker(ticker)
             data = t.yahoo_api_price()
             if isinstance(data, pd.DataFrame) and 'exchangeName' in data.columns and not data['exchangeName'].empty:
-                exchange_code = str(data['exchangeName'].iloc[0]).strip().upper()
+                exchange_code = str(data['exchangeName'].iat[0]).strip().upper()
                 if exchange_code and exchange_code not in ('YHD', ''):  # Skip historical marker and empty
                     exchange_map = {
                         "NMS": "NASDAQ", "NYQ": "NYSE", "ASE": "AMEX", 
@@ -48,12 +48,8 @@ class DiscoveryJob:
 
         provider = create_provider(self.target_cfg)
         try:
-            provider_output = provider.discover(self.target_cfg)
-            # Provider may return a pandas.DataFrame (preferred) or an iterable
-            if isinstance(provider_output, pd.DataFrame):
-                items = provider_output.to_dict(orient="records")
-            else:
-                items = list(provider_output)
+            # Providers return an iterable of record dicts; materialize once.
+            items = list(provider.discover(self.target_cfg))
         except Exception as e:
             # Finalize job run as FAILED with error details and re-raise
             self.job_run_repo.finalize(job_run_id=job_run_id, status="FAILED", items_total=0, items_succeeded=0, items_failed=0, error_summary=str(e), error_details=None)
@@ -62,31 +58,53 @@ class DiscoveryJob:
         results = []
         succeeded = 0
         failed = 0
+        # Instruments and memberships are accumulated during the loop
+        # and flushed in batch statements afterwards — one transaction
+        # each instead of a commit per ticker.  The loop itself only
+        # does the per-ticker exchange lookup.
+        instrument_rows: List[dict] = []
+        pending: List[dict] = []  # per-row metadata for the post-batch bookkeeping
 
         for it in items:
             ticker = it.get("ticker")
             country = it.get("country", self.target_cfg.get("country"))
             index_code = it.get("index_code", self.target_cfg.get("index_code"))
             try:
-                country = it.get("country", self.target_cfg.get("country"))
                 exchange = it.get("exchange", self.target_cfg.get("exchange"))
                 if country and country.upper() == "US":
                     exchange = self._get_exchange_for_ticker(ticker)
-                
+
                 if exchange:
                     logging.info(f"Found exchange for {ticker}: {exchange}")
 
-                instrument_id = self.instrument_repo.upsert(ticker=ticker, country=country, instrument_type=it.get("instrument_type"), exchange=exchange, created_by_job_run_id=job_run_id)
-                membership_id = self.index_membership_repo.upsert(index_code=index_code, instrument_id=instrument_id, country=country, effective_date=it.get("effective_date"), created_by_job_run_id=job_run_id)
-                self.job_run_item_repo.upsert(job_run_id=job_run_id, item_key=ticker, status="SUCCESS")
-                results.append({"ticker": ticker, "country": country, "index_code": index_code, "_status": "SUCCESS"})
-                succeeded += 1
+                instrument_rows.append({"ticker": ticker, "country": country, "instrument_type": it.get("instrument_type"), "exchange": exchange, "created_by_job_run_id": job_run_id, "updated_by_job_run_id": None})
+                pending.append({"ticker": ticker, "country": country, "index_code": index_code, "effective_date": it.get("effective_date")})
             except Exception as e:
                 self.job_run_item_repo.upsert(job_run_id=job_run_id, item_key=ticker or "<unknown>", status="FAILED", error_summary=str(e))
                 results.append({"ticker": ticker, "country": country, "index_code": index_code, "_status": "FAILED"})
                 failed += 1
 
         total = len(items)
+
+        try:
+            instrument_ids = self.instrument_repo.upsert_many(instrument_rows)
+        except Exception as e:
+            self.job_run_repo.finalize(job_run_id=job_run_id, status="FAILED", items_total=total, items_succeeded=succeeded, items_failed=failed, error_summary=f"instrument batch upsert failed: {e}")
+            raise
+
+        membership_rows: List[dict] = []
+        for meta, instrument_id in zip(pending, instrument_ids):
+            membership_rows.append({"index_code": meta["index_code"], "instrument_id": instrument_id, "country": meta["country"], "effective_date": meta["effective_date"], "created_by_job_run_id": job_run_id, "updated_by_job_run_id": None})
+            self.job_run_item_repo.upsert(job_run_id=job_run_id, item_key=meta["ticker"], status="SUCCESS")
+            results.append({"ticker": meta["ticker"], "country": meta["country"], "index_code": meta["index_code"], "_status": "SUCCESS"})
+            succeeded += 1
+
+        try:
+            self.index_membership_repo.upsert_many(membership_rows)
+        except Exception as e:
+            self.job_run_repo.finalize(job_run_id=job_run_id, status="FAILED", items_total=total, items_succeeded=succeeded, items_failed=failed, error_summary=f"membership batch upsert failed: {e}")
+            raise
+
         final_status = "FAILED" if failed > 0 else "SUCCESS"
         self.job_run_repo.finalize(job_run_id=job_run_id, status=final_status, items_total=total, items_succeeded=succeeded, items_failed=failed)
 
@@ -67,12 +67,16 @@ class FundamentalsJob:
         succeeded = 0
         failed = 0
 
-        for inst in instruments:
+        # Fetch all tickers concurrently up front (network-bound); the
+        # loop below only does DB writes and bookkeeping.  Failed pairs
+        # come back as {"error": ...} and are handled per ticker.
+        metrics_list = provider.compute_many([(inst.get("ticker"), inst.get("country")) for inst in instruments])
+
+        for inst, metrics in zip(instruments, metrics_list):
             t = inst.get("ticker")
             try:
-                metrics = provider.compute(t, inst.get("country"))
-                if not metrics:
-                    raise RuntimeError("provider returned no metrics")
+                if not metrics or "error" in metrics:
+                    raise RuntimeError(metrics["error"] if metrics else "provider returned no metrics")
 
                 # If provider produced metrics, persist snapshot
                 as_of = metrics.get("as_of_date") or date.today()
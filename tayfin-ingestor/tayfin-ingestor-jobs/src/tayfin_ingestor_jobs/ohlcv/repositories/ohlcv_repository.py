@@ -93,6 +93,21 @@ class OhlcvRepository:
         )
         return len(params)
 
+    def refresh_latest_view(self) -> None:
+        """Refresh ``mv_ohlcv_latest`` after a load.
+
+        CONCURRENTLY keeps API readers unblocked (requires the unique
+        index from migration V6) and cannot run inside a transaction,
+        hence the AUTOCOMMIT connection.
+        """
+        with self.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY tayfin_ingestor.mv_ohlcv_latest")
+            )
+        logger.info("mv_ohlcv_latest refreshed")
+
     def get_date_bounds(
         self,
         instrument_id: str,
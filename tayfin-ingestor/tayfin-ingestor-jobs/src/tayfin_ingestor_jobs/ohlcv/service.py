@@ -149,6 +149,14 @@ def run_ohlcv_ingestion(
     # ------------------------------------------------------------------
     # Finalize job run
     # ------------------------------------------------------------------
+    # Keep the latest-per-instrument view current for API readers; a
+    # refresh failure must not fail an otherwise successful ingestion.
+    if succeeded > 0:
+        try:
+            ohlcv_repo.refresh_latest_view()
+        except Exception as exc:
+            logger.warning("mv_ohlcv_latest refresh failed: %s", exc)
+
     total = len(instruments)
     final_status = "FAILED" if failed > 0 else "SUCCESS"
     job_run_repo.finalize(
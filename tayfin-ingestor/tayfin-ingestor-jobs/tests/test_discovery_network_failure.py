@@ -7,11 +7,13 @@ from sqlalchemy import text
 
 def test_discovery_network_failure(monkeypatch):
     """Simulate a network error during provider fetch and ensure the job is audited as FAILED."""
-    # Monkeypatch httpx.Client.get to raise a connection error
-    def fake_get(self, url, *args, **kwargs):
+    # Monkeypatch httpx.Client.send to raise a connection error; both
+    # get() and stream() funnel through send, so this covers the
+    # provider's streaming fetch.
+    def fake_send(self, request, *args, **kwargs):
         raise httpx.ConnectError("simulated network failure")
 
-    monkeypatch.setattr(httpx.Client, "get", fake_get)
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
 
     # Run the job and expect an exception
     job = DiscoveryJob.from_config(target_cfg={"code": "nasdaq100", "country": "US", "index_code": "NDX"})